@@ -12,34 +12,40 @@ This package provides:
 - Terminal UX (TUX)
 """
 
-from codeai.cli import agent, main
-from codeai.tux import CodeAITux, run_tux
+import importlib
+import importlib.util
+import os
 
-# ACP client for remote agent connections (from agent-runtimes)
-try:
-    from agent_runtimes.transports.clients import (
-        ACPClient,
-        ACPClientError,
-        connect_acp,
-    )
-    # Re-export SDK types for convenience
-    from acp import (
-        InitializeRequest,
-        InitializeResponse,
-        NewSessionRequest,
-        NewSessionResponse,
-        PromptRequest,
-        PromptResponse,
-        SessionNotification,
-    )
-    from acp.schema import (
-        AgentCapabilities,
-        ClientCapabilities,
-        Implementation,
-    )
-    _has_acp = True
-except ImportError:
-    _has_acp = False
+# Public API, imported from its module on first access (PEP 562) so that
+# ``import codeai`` doesn't pull in the CLI, the TUX and their dependencies.
+_LAZY_EXPORTS = {
+    "agent": "codeai.cli",
+    "main": "codeai.cli",
+    "CodeAITux": "codeai.tux",
+    "run_tux": "codeai.tux",
+}
+
+# ACP client and SDK types (from agent-runtimes), resolved on first access so
+# that plain CLI runs don't pay for importing them. Set CODEAI_EAGER_IMPORTS=1
+# to import them with the package instead.
+_ACP_EXPORTS = {
+    "ACPClient": "agent_runtimes.transports.clients",
+    "ACPClientError": "agent_runtimes.transports.clients",
+    "connect_acp": "agent_runtimes.transports.clients",
+    # SDK types
+    "InitializeRequest": "acp",
+    "InitializeResponse": "acp",
+    "NewSessionRequest": "acp",
+    "NewSessionResponse": "acp",
+    "PromptRequest": "acp",
+    "PromptResponse": "acp",
+    "SessionNotification": "acp",
+    "AgentCapabilities": "acp.schema",
+    "ClientCapabilities": "acp.schema",
+    "Implementation": "acp.schema",
+}
+
+_has_acp = all(importlib.util.find_spec(name) is not None for name in ("acp", "agent_runtimes"))
 
 __all__ = [
     "agent",
@@ -49,19 +55,28 @@ __all__ = [
 ]
 
 if _has_acp:
-    __all__.extend([
-        "ACPClient",
-        "ACPClientError",
-        "connect_acp",
-        # SDK types
-        "InitializeRequest",
-        "InitializeResponse",
-        "NewSessionRequest",
-        "NewSessionResponse",
-        "PromptRequest",
-        "PromptResponse",
-        "SessionNotification",
-        "AgentCapabilities",
-        "ClientCapabilities",
-        "Implementation",
-    ])
+    __all__.extend(_ACP_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve the public API and the ACP re-exports lazily (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None and _has_acp:
+        module_name = _ACP_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if _has_acp and os.environ.get("CODEAI_EAGER_IMPORTS"):
+    try:
+        for _name in _ACP_EXPORTS:
+            __getattr__(_name)
+    except ImportError:
+        pass
@@ -0,0 +1,31 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""JSON decoding for Code AI.
+
+``loads`` is orjson's when it is installed, else the stdlib one; both
+raise a ValueError subclass on invalid input.
+"""
+
+from typing import Any
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+def response_json(response: Any) -> Any:
+    """Decode the JSON body of an httpx response.
+
+    Uses orjson when it is installed, which decodes the large context
+    tables and exports several times faster than the stdlib json module.
+
+    Args:
+        response: A read httpx.Response.
+
+    Returns:
+        The decoded JSON value.
+    """
+    return loads(response.content)
@@ -0,0 +1,76 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Event loop setup for Code AI."""
+
+import asyncio
+import atexit
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Event loop shared by every run_coroutine() call of the process
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for the shared event loop of ``run_coroutine`` when it is installed.
+
+    Must be called before the first ``run_coroutine``, which creates the loop.
+
+    The TUX and its animations schedule many short timer wakeups, which
+    uvloop handles in libuv instead of the pure Python scheduler.
+
+    Returns:
+        True if uvloop was installed, False otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the process-wide event loop.
+
+    Unlike ``asyncio.run``, the loop (with its default executor and anything
+    bound to it) is kept between calls and only closed at exit.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_close_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _close_loop() -> None:
+    """Cancel what is left on the shared loop and close it, as ``asyncio.run`` does."""
+    loop = _loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    except RuntimeError:
+        # The loop was left running or stopped by an interrupted call:
+        # nothing more can be cleaned up, just close it
+        pass
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
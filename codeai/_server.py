@@ -0,0 +1,466 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Agent-runtimes server process for Code AI.
+
+Runs in the child process started by the CLI, either forked from the
+forkserver (``run_agent_runtime_server``) or executed directly with
+``python -m codeai._server``. Kept apart from ``codeai.cli`` so the server
+process never imports the CLI and its dependencies.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import secrets
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+# Seconds a reusable server (codeai --reuse-server) stays up after its
+# last use (0 disables reuse)
+IDLE_TIMEOUT = float(os.environ.get("CODEAI_SERVER_IDLE_TIMEOUT", "300"))
+
+
+def run_agent_runtime_server(
+    host: str,
+    port: int,
+    agent_id: str,
+    codemode: bool,
+    protocol: str,
+    port_value=None,
+    debug: bool = False,
+):
+    """Run the agent-runtimes server (for multiprocessing).
+
+    This must be a module-level function (not nested) to be picklable.
+
+    Args:
+        host: Host to bind to
+        port: Requested port (0 = auto-select a random free port)
+        agent_id: Agent spec ID
+        codemode: Enable codemode
+        protocol: Name of the agent_runtimes.commands.Protocol member
+        port_value: Optional multiprocessing.Value('i') to communicate the
+            effective port back to the parent process.
+        debug: Keep the server output and enable debug logging. Passed
+            explicitly because a forkserver child gets the environment of
+            the forkserver, not CODEAI_DEBUG set by the CLI later on.
+    """
+    from agent_runtimes.commands import Protocol, find_random_free_port, serve_server
+    from agent_runtimes.specs.agents import get_agent_spec
+
+    # Only suppress logging if not in debug mode
+    debug_mode = debug or os.environ.get("CODEAI_DEBUG") == "1"
+
+    if not debug_mode:
+        # Redirect stdout and stderr to devnull to keep terminal clean
+        devnull = open(os.devnull, "w")
+        sys.stdout = devnull
+        sys.stderr = devnull
+
+        # Suppress all logging
+        logging.getLogger().setLevel(logging.CRITICAL)
+        logging.getLogger("uvicorn").setLevel(logging.CRITICAL)
+        logging.getLogger("uvicorn.access").setLevel(logging.CRITICAL)
+        logging.getLogger("uvicorn.error").setLevel(logging.CRITICAL)
+        logging.getLogger("rich").setLevel(logging.CRITICAL)
+
+        # Disable Rich console output
+        os.environ["TERM"] = "dumb"
+        os.environ["NO_COLOR"] = "1"
+    else:
+        # Enable debug logging
+        logging.basicConfig(level=logging.DEBUG)
+        logging.getLogger(__name__).debug("Starting agent runtime server in debug mode")
+
+    # Resolve port in this process so we can communicate it back
+    actual_port = port
+    if port == 0:
+        actual_port = find_random_free_port(host)
+
+    # Write effective port to shared value so the parent process can read it
+    if port_value is not None:
+        port_value.value = actual_port
+
+    # Load agent spec to get MCP servers and sandbox variant
+    mcp_servers_str = "tavily"  # Default fallback
+    sandbox_variant = "jupyter"  # Default for codeai
+    agent_spec = get_agent_spec(agent_id)
+    if agent_spec:
+        if agent_spec.mcp_servers:
+            mcp_servers_str = ",".join([server.id for server in agent_spec.mcp_servers])
+        if agent_spec.sandbox_variant:
+            sandbox_variant = agent_spec.sandbox_variant
+
+    serve_server(
+        host=host,
+        port=actual_port,
+        agent_id=agent_id,
+        agent_name="codeai",
+        no_config_mcp_servers=True,  # Disable config MCP servers
+        mcp_servers=mcp_servers_str,  # Use MCP servers from agent spec
+        codemode=codemode,  # Enable/disable codemode based on flag
+        sandbox_variant=sandbox_variant if codemode else None,
+        protocol=Protocol[protocol],
+    )
+
+
+class ServerProcess:
+    """``multiprocessing.Process``-like handle on a server run with ``popen_server``.
+
+    Lets the CLI clean up either kind of server child the same way.
+    """
+
+    def __init__(self, popen: subprocess.Popen):
+        self.popen = popen
+        self.pid = popen.pid
+
+    def is_alive(self) -> bool:
+        """Return whether the server process is still running."""
+        return self.popen.poll() is None
+
+    def terminate(self) -> None:
+        """Ask the server process to stop (SIGTERM)."""
+        self.popen.terminate()
+
+    def kill(self) -> None:
+        """Kill the server process (SIGKILL)."""
+        self.popen.kill()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait at most ``timeout`` seconds for the server process to exit."""
+        try:
+            self.popen.wait(timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def free_port(host: str) -> int:
+    """Return a port that is currently free on ``host``."""
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def popen_server(
+    host: str,
+    port: int,
+    agent_id: str,
+    codemode: bool,
+    protocol: str,
+    debug: bool = False,
+    state_file: Optional[str] = None,
+    token: Optional[str] = None,
+) -> ServerProcess:
+    """Start the server as a fresh ``python -m codeai._server`` process.
+
+    Used where no forkserver is available, and for reusable servers that
+    must outlive the CLI: unlike a spawned multiprocessing child, nothing
+    is pickled and the parent's modules are not re-imported, and output
+    goes straight to devnull at the OS level.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to (must be resolved, not 0)
+        agent_id: Agent spec ID
+        codemode: Enable codemode
+        protocol: Name of the agent_runtimes.commands.Protocol member
+        debug: Keep the server output on the terminal
+        state_file: State file of a reusable server, which then stops by
+            itself once the file goes unused for IDLE_TIMEOUT seconds
+        token: Random marker put on the server's command line, by which
+            ``_is_server`` recognizes the process later
+
+    Returns:
+        A handle on the server process.
+    """
+    args = [
+        sys.executable, "-m", "codeai._server",
+        "--host", host,
+        "--port", str(port),
+        "--agent-id", agent_id,
+        "--protocol", protocol,
+    ]
+    if not codemode:
+        args.append("--no-codemode")
+    if state_file is not None:
+        args += ["--state-file", state_file, "--idle-timeout", str(IDLE_TIMEOUT)]
+    if token is not None:
+        args += ["--token", token]
+    if debug:
+        args.append("--debug")
+
+    output = None if debug else subprocess.DEVNULL
+    env = dict(os.environ)
+    if not debug:
+        env.update(TERM="dumb", NO_COLOR="1")
+
+    popen = subprocess.Popen(  # noqa: S603 - our own interpreter and module, no shell
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=output,
+        stderr=output,
+        env=env,
+        start_new_session=True,
+    )
+    return ServerProcess(popen)
+
+
+def reuse_enabled() -> bool:
+    """Return whether query runs may leave a server behind for later runs."""
+    return IDLE_TIMEOUT > 0 and os.name == "posix" and _state_dir() is not None
+
+
+def _state_dir() -> Optional[str]:
+    """Return this user's private directory for server state files.
+
+    The directory is created with mode 0700. It is only used when it is a
+    real directory owned by the current user that nobody else can access,
+    so other local users can neither plant nor read state files.
+
+    Returns:
+        The directory path, or None if it cannot be used safely.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    path = os.path.join(base, f"codeai-{os.getuid()}")
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def _state_path(agent_id: str, codemode: bool) -> Optional[str]:
+    """Return the state file of the reusable server for an agent spec.
+
+    Servers are per user, agent spec, codemode and working directory, as
+    the server works with the directory it was started from.
+
+    Returns:
+        The state file path, or None if there is no safe state directory.
+    """
+    base = _state_dir()
+    if base is None:
+        return None
+    cwd = hashlib.sha1(os.getcwd().encode(), usedforsecurity=False).hexdigest()[:12]
+    name = f"{agent_id}-{'codemode' if codemode else 'plain'}-{cwd}.json"
+    return os.path.join(base, name.replace(os.sep, "_"))
+
+
+def _read_state(path: str) -> Optional[dict]:
+    """Read a server state file.
+
+    Returns:
+        The state, or None when the file is missing, unreadable, not owned
+        by the current user or writable by anyone else.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    try:
+        with os.fdopen(fd) as f:
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                return None
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _is_server(state: dict) -> bool:
+    """Return whether a state's pid is a live server this CLI started.
+
+    The pid could have been reused by another process since the state was
+    written, so the process must carry the state's random token on its
+    command line.
+    """
+    pid, token = state.get("pid"), state.get("token")
+    if not isinstance(pid, int) or not isinstance(token, str) or pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    if os.path.isdir("/proc/self"):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="replace").split("\0")
+        except OSError:
+            return False
+    else:
+        try:
+            # No /proc (e.g. macOS): ask ps, a fixed command run without a shell
+            cmdline = subprocess.run(  # noqa: S603 - fixed arguments
+                ["ps", "-ww", "-o", "command=", "-p", str(pid)],  # noqa: S607 - ps from PATH
+                capture_output=True, text=True, check=False,
+            ).stdout.split()
+        except OSError:
+            return False
+    return token in cmdline
+
+
+def find_warm_server(agent_id: str, codemode: bool) -> Optional[int]:
+    """Find a reusable server left running by an earlier query.
+
+    Renews the server's lease when one is found.
+
+    Args:
+        agent_id: Agent spec ID
+        codemode: Whether the server must run with codemode
+
+    Returns:
+        The port of the server, or None if there is none to reuse.
+    """
+    path = _state_path(agent_id, codemode)
+    if path is None:
+        return None
+    state = _read_state(path)
+    if state is None:
+        return None
+    port = state.get("port")
+    if not _is_server(state) or not isinstance(port, int):
+        # The server is gone (crashed or killed) without removing its state
+        with contextlib.suppress(OSError):
+            os.remove(path)
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return port
+
+
+def start_warm_server(host: str, agent_id: str, codemode: bool, protocol: str) -> int:
+    """Start a detached, reusable server that outlives this process.
+
+    The server records itself in a state file that later runs find with
+    ``find_warm_server``, and stops once nobody used it for IDLE_TIMEOUT
+    seconds.
+
+    Args:
+        host: Host to bind to
+        agent_id: Agent spec ID
+        codemode: Enable codemode
+        protocol: Name of the agent_runtimes.commands.Protocol member
+
+    Returns:
+        The port the server listens on.
+
+    Raises:
+        OSError: If there is no safe directory for the state file.
+    """
+    path = _state_path(agent_id, codemode)
+    if path is None:
+        raise OSError("No private directory for the server state")
+    port = free_port(host)
+    token = secrets.token_hex(16)
+    process = popen_server(host, port, agent_id, codemode, protocol, state_file=path, token=token)
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), delete=False) as f:
+        json.dump({"pid": process.pid, "port": port, "token": token}, f)
+    os.replace(f.name, path)
+    return port
+
+
+def forget_warm_server(agent_id: str, codemode: bool) -> None:
+    """Stop the reusable server of an agent spec, if any, and drop its state."""
+    path = _state_path(agent_id, codemode)
+    if path is None:
+        return
+    state = _read_state(path)
+    with contextlib.suppress(OSError):
+        os.remove(path)
+    if state is not None and _is_server(state):
+        with contextlib.suppress(OSError):
+            os.kill(state["pid"], signal.SIGTERM)
+
+
+@contextlib.contextmanager
+def hold_lease(agent_id: str, codemode: bool) -> Iterator[None]:
+    """Keep the reusable server's lease renewed while the block runs.
+
+    Stops a long query from outliving the server's idle timeout.
+    """
+    path = _state_path(agent_id, codemode)
+    if path is None:
+        yield
+        return
+    done = threading.Event()
+
+    def renew():
+        while not done.wait(IDLE_TIMEOUT / 3):
+            with contextlib.suppress(OSError):
+                os.utime(path)
+
+    thread = threading.Thread(target=renew, name="codeai-lease", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+
+def _watch_idle(state_file: str, idle_timeout: float) -> None:
+    """Stop this server once its state file is gone, taken over or left unused."""
+    pid = os.getpid()
+    while True:
+        time.sleep(min(idle_timeout / 4, 30.0))
+        state = _read_state(state_file)
+        try:
+            idle = time.time() - os.stat(state_file).st_mtime
+        except OSError:
+            idle = idle_timeout
+        if state is not None and state.get("pid") == pid and idle < idle_timeout:
+            continue
+        if state is not None and state.get("pid") == pid:
+            with contextlib.suppress(OSError):
+                os.remove(state_file)
+        # Let uvicorn shut down gracefully
+        os.kill(pid, signal.SIGTERM)
+        return
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Parse the command line and run the server."""
+    parser = argparse.ArgumentParser(prog="python -m codeai._server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--agent-id", required=True)
+    parser.add_argument("--protocol", default="ag_ui")
+    parser.add_argument("--no-codemode", dest="codemode", action="store_false")
+    parser.add_argument("--state-file")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    # Marker identifying a reusable server process, see _is_server
+    parser.add_argument("--token")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args(argv)
+    if args.state_file:
+        threading.Thread(
+            target=_watch_idle,
+            args=(args.state_file, args.idle_timeout),
+            name="codeai-idle",
+            daemon=True,
+        ).start()
+    run_agent_runtime_server(
+        args.host, args.port, args.agent_id, args.codemode, args.protocol, debug=args.debug
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,35 @@
 #
 # BSD 3-Clause License
 
-"""Animation modules for Code AI TUX Easter eggs."""
+"""Animation modules for Code AI TUX Easter eggs.
 
-from .rain import rain_animation
-from .about import about_animation
-from .gif import gif_animation
+Submodules are imported on first attribute access (PEP 562), so importing
+the package does not load Rich renderables or probe for PIL until an
+animation is actually played.
+"""
 
-__all__ = ["rain_animation", "about_animation", "gif_animation"]
+import importlib
+
+# Public animation name -> submodule defining it
+_ANIMATIONS = {
+    "rain_animation": ".rain",
+    "about_animation": ".about",
+    "gif_animation": ".gif",
+}
+
+__all__ = list(_ANIMATIONS)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access."""
+    try:
+        module_name = _ANIMATIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,69 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Shared playback of precomputed animation frames."""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from rich.console import Console, RenderableType
+from rich.live import Live
+
+from .utils import raw_terminal, run_timeline, timeline
+
+
+async def run_timeline_frames(
+    console: Console,
+    frames: Sequence[tuple[RenderableType, float]],
+    *,
+    refresh_per_second: float = 8,
+) -> bool:
+    """Play (renderable, delay) pairs in a transient Live display.
+
+    Frames are only pushed to Live when they are a different object than
+    the one on screen, and playback stops as soon as ESCAPE is pressed.
+
+    Args:
+        console: Rich Console instance for output.
+        frames: Renderables with the time each stays on screen.
+        refresh_per_second: Refresh rate of the Live display.
+
+    Returns:
+        True if playback was interrupted with ESCAPE.
+    """
+    live = Live(console=console, refresh_per_second=refresh_per_second, transient=True)
+    with raw_terminal() as escape, live:
+        last: Optional[Any] = None
+
+        def show(frame: RenderableType) -> None:
+            nonlocal last
+            if frame is not last:
+                live.update(frame)
+                last = frame
+
+        await run_timeline(frames, show, escape)
+        return escape.is_set()
+
+
+async def run_frames(
+    console: Console,
+    frames: Sequence[RenderableType],
+    *,
+    fps: float,
+    duration: Optional[float] = None,
+) -> bool:
+    """Play renderables at a fixed rate in a transient Live display.
+
+    Args:
+        console: Rich Console instance for output.
+        frames: Renderables to show, in order.
+        fps: Frames per second.
+        duration: Loop the frames for this many seconds; play them once if None.
+
+    Returns:
+        True if playback was interrupted with ESCAPE.
+    """
+    return await run_timeline_frames(
+        console, timeline(frames, fps, duration), refresh_per_second=fps
+    )
@@ -4,21 +4,99 @@
 
 """About/Logo animation for Code AI TUX."""
 
-import asyncio
-import time
+from functools import cache
 
 from rich.console import Console
-from rich.live import Live
 from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 
-from .utils import raw_terminal, check_escape_pressed
+from ._runner import run_timeline_frames
+from .utils import timeline
 
 
 # Primary accent color (matches tux.py)
 STYLE_PRIMARY = Style(color="rgb(26,188,156)")
 
+# Logo layers (from top to bottom), the last one being the feet
+LOGO_ROWS = ("▄▄▄▄▄▄", "▄▄▄▄▄▄", "▄▄▄▄▄▄", "▀    ▀")
+
+# Number of steps the logo walks to the right
+WALK_STEPS = 22
+
+# Starting offset (spaces before logo)
+BASE_OFFSET = 3
+
+# Left padding for every column the logo can occupy, built once
+PADS = tuple(" " * i for i in range(BASE_OFFSET + WALK_STEPS + 2))
+
+# Logo layer styles
+S_CYAN = Style(color="cyan")
+S_GREEN = Style(color="green")
+S_BRIGHT_GREEN = Style(color="bright_green")
+S_BOLD_BRIGHT_GREEN = Style(color="bright_green", bold=True)
+
+# Tagline styles
+S_BOLD_WHITE = Style(color="white", bold=True)
+S_DIM = Style(dim=True)
+
+# Each logo layer split in its left and right part, styled separately when blinking
+LOGO_SPLITS = (("▄▄", "▄▄▄▄"), ("▄▄▄", "▄▄▄"), ("▄▄▄▄", "▄▄"), ("▀", "    ▀"))
+
+# (left, right) styles of the 6 blinking frames
+BLINK_STYLES = (
+    (S_CYAN, S_CYAN),
+    (S_GREEN, S_CYAN),
+    (S_BRIGHT_GREEN, S_GREEN),
+    (S_BOLD_BRIGHT_GREEN, S_BRIGHT_GREEN),  # Pulse
+    (S_BRIGHT_GREEN, S_GREEN),
+    (S_GREEN, S_CYAN),
+)
+
+# Panel options shared by every frame
+_PANEL_KW = {
+    "border_style": STYLE_PRIMARY,
+    "title": " Datalayer ",
+    "subtitle": Text("datalayer.ai", style=Style(link="https://datalayer.ai")),
+}
+
+
+def _logo_panel(text: Text) -> Panel:
+    """Add the tagline below the logo and wrap the frame into the Datalayer panel."""
+    text.append("\n\n")
+    text.append("AI Agents for Data Analysis", style=S_BOLD_WHITE)
+    text.append("\n")
+    text.append("Cheaper • Faster • Collaborative", style=S_DIM)
+    text.append("\n")
+    return Panel(text, **_PANEL_KW)
+
+
+@cache
+def _blink_panel(offset: int, left: Style, right: Style) -> Panel:
+    """Build a blinking logo frame indented by ``offset``.
+
+    Identical frames share the same Panel, so playback can skip them by identity.
+    """
+    text = Text()
+    for left_part, right_part in LOGO_SPLITS:
+        text.append("\n")
+        text.append(PADS[offset])
+        text.append(left_part, style=left)
+        text.append(right_part, style=right)
+    return _logo_panel(text)
+
+
+@cache
+def _walk_panel(offset: int, moved: int) -> Panel:
+    """Build a walking sub-frame where the ``moved`` bottom layers already stepped right."""
+    text = Text()
+    for row, layer in enumerate(LOGO_ROWS):
+        shift = 1 if row >= len(LOGO_ROWS) - moved else 0
+        text.append("\n")
+        text.append(PADS[offset + shift])
+        text.append(layer, style=S_BRIGHT_GREEN)
+    return _logo_panel(text)
+
 
 async def about_animation(console: Console) -> None:
     """Display About Datalayer animation with walking logo.
@@ -26,63 +104,23 @@ async def about_animation(console: Console) -> None:
     Args:
         console: Rich Console instance for output.
     """
-    # Simple Datalayer logo animation frames with tagline
-    tagline = "[bold white]AI Agents for Data Analysis[/bold white]\n[dim]Cheaper • Faster • Collaborative[/dim]"
+    final_offset = BASE_OFFSET + WALK_STEPS
+
+    # All frames are deterministic: render every panel once before playback
+    blink_panels = [_blink_panel(BASE_OFFSET, left, right) for left, right in BLINK_STYLES]
+    # Each step: feet move, then layer 3, then layer 2, then layer 1
+    walk_panels = [
+        _walk_panel(BASE_OFFSET + step, moved)
+        for step in range(WALK_STEPS)
+        for moved in range(1, 5)
+    ]
+    final_panels = [_blink_panel(final_offset, left, right) for left, right in BLINK_STYLES]
+    
+    # Blink for 2 seconds, walk right, then blink for 2 seconds at the final position
     frames = [
-        # Frame 1
-        Text.from_markup(f"""
-   [cyan]▄▄▄▄▄▄[/cyan]
-   [cyan]▄▄▄▄▄▄[/cyan]
-   [cyan]▄▄▄▄▄▄[/cyan]
-   [cyan]▀    ▀[/cyan]
-
-{tagline}
-"""),
-        # Frame 2
-        Text.from_markup(f"""
-   [green]▄▄[/green][cyan]▄▄▄▄[/cyan]
-   [green]▄▄▄[/green][cyan]▄▄▄[/cyan]
-   [green]▄▄▄▄[/green][cyan]▄▄[/cyan]
-   [green]▀[/green]    [cyan]▀[/cyan]
-
-{tagline}
-"""),
-        # Frame 3
-        Text.from_markup(f"""
-   [bright_green]▄▄[/bright_green][green]▄▄▄▄[/green]
-   [bright_green]▄▄▄[/bright_green][green]▄▄▄[/green]
-   [bright_green]▄▄▄▄[/bright_green][green]▄▄[/green]
-   [bright_green]▀[/bright_green]    [green]▀[/green]
-
-{tagline}
-"""),
-        # Frame 4 - pulse
-        Text.from_markup(f"""
-   [bold bright_green]▄▄[/bold bright_green][bright_green]▄▄▄▄[/bright_green]
-   [bold bright_green]▄▄▄[/bold bright_green][bright_green]▄▄▄[/bright_green]
-   [bold bright_green]▄▄▄▄[/bold bright_green][bright_green]▄▄[/bright_green]
-   [bold bright_green]▀[/bold bright_green]    [bright_green]▀[/bright_green]
-
-{tagline}
-"""),
-        # Frame 5
-        Text.from_markup(f"""
-   [bright_green]▄▄[/bright_green][green]▄▄▄▄[/green]
-   [bright_green]▄▄▄[/bright_green][green]▄▄▄[/green]
-   [bright_green]▄▄▄▄[/bright_green][green]▄▄[/green]
-   [bright_green]▀[/bright_green]    [green]▀[/green]
-
-{tagline}
-"""),
-        # Frame 6
-        Text.from_markup(f"""
-   [green]▄▄[/green][cyan]▄▄▄▄[/cyan]
-   [green]▄▄▄[/green][cyan]▄▄▄[/cyan]
-   [green]▄▄▄▄[/green][cyan]▄▄[/cyan]
-   [green]▀[/green]    [cyan]▀[/cyan]
-
-{tagline}
-"""),
+        *timeline(blink_panels, fps=1 / 0.15, duration=2.0),
+        *timeline(walk_panels, fps=1 / 0.08),
+        *timeline(final_panels, fps=1 / 0.15, duration=2.0),
     ]
     
     console.print()
@@ -90,153 +128,8 @@ async def about_animation(console: Console) -> None:
     console.print()
     
     try:
-        with raw_terminal(), Live(console=console, refresh_per_second=8, transient=True) as live:
-            # Phase 1: Blinking for 2 seconds
-            start_time = time.time()
-            duration = 2.0
-            
-            while time.time() - start_time < duration:
-                if check_escape_pressed():
-                    return
-                for frame in frames:
-                    if check_escape_pressed():
-                        return
-                    if time.time() - start_time >= duration:
-                        break
-                    live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                    await asyncio.sleep(0.15)
-            
-            # Phase 2: Walking animation - logo moves right
-            # Each step: feet move, then layer 3, then layer 2, then layer 1
-            # Logo layers (from top to bottom):
-            # Line 1: ▄▄▄▄▄▄
-            # Line 2: ▄▄▄▄▄▄
-            # Line 3: ▄▄▄▄▄▄
-            # Line 4: ▀    ▀  (feet)
-            
-            base_offset = 3  # Starting offset (spaces before logo)
-            
-            for step in range(22):  # 22 steps to the right
-                if check_escape_pressed():
-                    return
-                offset = base_offset + step
-                
-                # Sub-frame 1: Feet move first
-                frame = Text.from_markup(f"""
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▀    ▀[/bright_green]
-
-{tagline}
-""")
-                live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                await asyncio.sleep(0.08)
-                
-                # Sub-frame 2: Layer 3 moves
-                frame = Text.from_markup(f"""
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▀    ▀[/bright_green]
-
-{tagline}
-""")
-                live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                await asyncio.sleep(0.08)
-                
-                # Sub-frame 3: Layer 2 moves
-                frame = Text.from_markup(f"""
-{' ' * offset}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▀    ▀[/bright_green]
-
-{tagline}
-""")
-                live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                await asyncio.sleep(0.08)
-                
-                # Sub-frame 4: Layer 1 (top) moves - logo fully shifted
-                frame = Text.from_markup(f"""
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▄▄▄▄▄▄[/bright_green]
-{' ' * (offset + 1)}[bright_green]▀    ▀[/bright_green]
-
-{tagline}
-""")
-                live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                await asyncio.sleep(0.08)
-            
-            # Phase 3: Blinking for 2 seconds at final position
-            final_offset = base_offset + 22
-            start_time = time.time()
-            duration = 2.0
-            
-            # Create frames at the final position
-            final_frames = [
-                Text.from_markup(f"""
-{' ' * final_offset}[cyan]▄▄▄▄▄▄[/cyan]
-{' ' * final_offset}[cyan]▄▄▄▄▄▄[/cyan]
-{' ' * final_offset}[cyan]▄▄▄▄▄▄[/cyan]
-{' ' * final_offset}[cyan]▀    ▀[/cyan]
-
-{tagline}
-"""),
-                Text.from_markup(f"""
-{' ' * final_offset}[green]▄▄[/green][cyan]▄▄▄▄[/cyan]
-{' ' * final_offset}[green]▄▄▄[/green][cyan]▄▄▄[/cyan]
-{' ' * final_offset}[green]▄▄▄▄[/green][cyan]▄▄[/cyan]
-{' ' * final_offset}[green]▀[/green]    [cyan]▀[/cyan]
-
-{tagline}
-"""),
-                Text.from_markup(f"""
-{' ' * final_offset}[bright_green]▄▄[/bright_green][green]▄▄▄▄[/green]
-{' ' * final_offset}[bright_green]▄▄▄[/bright_green][green]▄▄▄[/green]
-{' ' * final_offset}[bright_green]▄▄▄▄[/bright_green][green]▄▄[/green]
-{' ' * final_offset}[bright_green]▀[/bright_green]    [green]▀[/green]
-
-{tagline}
-"""),
-                Text.from_markup(f"""
-{' ' * final_offset}[bold bright_green]▄▄[/bold bright_green][bright_green]▄▄▄▄[/bright_green]
-{' ' * final_offset}[bold bright_green]▄▄▄[/bold bright_green][bright_green]▄▄▄[/bright_green]
-{' ' * final_offset}[bold bright_green]▄▄▄▄[/bold bright_green][bright_green]▄▄[/bright_green]
-{' ' * final_offset}[bold bright_green]▀[/bold bright_green]    [bright_green]▀[/bright_green]
-
-{tagline}
-"""),
-                Text.from_markup(f"""
-{' ' * final_offset}[bright_green]▄▄[/bright_green][green]▄▄▄▄[/green]
-{' ' * final_offset}[bright_green]▄▄▄[/bright_green][green]▄▄▄[/green]
-{' ' * final_offset}[bright_green]▄▄▄▄[/bright_green][green]▄▄[/green]
-{' ' * final_offset}[bright_green]▀[/bright_green]    [green]▀[/green]
-
-{tagline}
-"""),
-                Text.from_markup(f"""
-{' ' * final_offset}[green]▄▄[/green][cyan]▄▄▄▄[/cyan]
-{' ' * final_offset}[green]▄▄▄[/green][cyan]▄▄▄[/cyan]
-{' ' * final_offset}[green]▄▄▄▄[/green][cyan]▄▄[/cyan]
-{' ' * final_offset}[green]▀[/green]    [cyan]▀[/cyan]
-
-{tagline}
-"""),
-            ]
-            
-            while time.time() - start_time < duration:
-                if check_escape_pressed():
-                    return
-                for frame in final_frames:
-                    if check_escape_pressed():
-                        return
-                    if time.time() - start_time >= duration:
-                        break
-                    live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Datalayer ", subtitle="[link=https://datalayer.ai]datalayer.ai[/link]"))
-                    await asyncio.sleep(0.15)
-                
+        if await run_timeline_frames(console, frames, refresh_per_second=8):
+            return
     except KeyboardInterrupt:
         pass
     
@@ -0,0 +1,87 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Download and on-disk caching of animation assets."""
+
+import gzip
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+# Spinning black hole GIF used by the /gif command and the splash screen
+BLACKHOLE_GIF_URL = "https://images.steamusercontent.com/ugc/480020637383985059/4AF1AFCA793CFFD924E6F880918F0DD181593552/"
+BLACKHOLE_GIF_NAME = "blackhole.gif"
+
+
+def cache_dir() -> Path:
+    """Return the Code AI cache directory (``$XDG_CACHE_HOME/codeai``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "codeai"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+def fetch_cached(url: str, name: str, timeout: float = 10.0) -> bytes:
+    """Return the content at ``url``, downloading it only once.
+
+    Args:
+        url: URL of the asset.
+        name: File name of the asset in the cache directory.
+        timeout: Download timeout in seconds.
+
+    Returns:
+        The asset bytes.
+
+    Raises:
+        urllib.error.URLError: If the asset is not cached and can't be downloaded.
+    """
+    path = cache_dir() / name
+    try:
+        return path.read_bytes()
+    except OSError:
+        pass
+
+    # The standard library client keeps the requests import off the startup path
+    from urllib.request import urlopen
+
+    with urlopen(url, timeout=timeout) as response:  # noqa: S310 - fixed https URLs
+        data = response.read()
+    try:
+        write_atomic(path, data)
+    except OSError:
+        pass  # Caching is best effort
+    return data
+
+
+def load_cached_object(name: str) -> Optional[Any]:
+    """Load an object pickled with :func:`save_cached_object`, or None if missing or unreadable."""
+    try:
+        data = (cache_dir() / name).read_bytes()
+        if name.endswith(".gz"):
+            data = gzip.decompress(data)
+        return pickle.loads(data)  # noqa: S301 - our own cache file
+    except Exception:
+        return None
+
+
+def save_cached_object(name: str, obj: Any) -> None:
+    """Pickle ``obj`` into the cache directory (best effort).
+
+    Names ending in ``.gz`` are gzip-compressed, favoring speed over size.
+    """
+    try:
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        if name.endswith(".gz"):
+            data = gzip.compress(data, compresslevel=1)
+        write_atomic(cache_dir() / name, data)
+    except (OSError, pickle.PicklingError):
+        pass  # Caching is best effort
@@ -4,22 +4,89 @@
 
 """GIF animation (black hole) for Code AI TUX."""
 
-import asyncio
 import shutil
-import time
 
 from rich.console import Console
-from rich.live import Live
 from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 
-from .utils import raw_terminal, check_escape_pressed
+from ._runner import run_frames
+from .assets import (
+    BLACKHOLE_GIF_NAME,
+    BLACKHOLE_GIF_URL,
+    fetch_cached,
+    load_cached_object,
+    save_cached_object,
+)
 
 
 # Primary accent color (matches tux.py)
 STYLE_PRIMARY = Style(color="rgb(26,188,156)")
 
+# Playback rate and length
+FPS = 12
+DURATION = 5.0
+
+# Most frames a playback can show: longer GIFs are sampled down to this
+MAX_FRAMES = int(DURATION * FPS) + 1
+
+# Bump when the frame conversion changes to invalidate cached frames
+FRAMES_CACHE_VERSION = 3
+
+# ASCII characters from dark to bright
+ASCII_CHARS = ' .:-=+*#%@'
+
+# Luma (0-255) to ASCII character, blank for pixels with brightness <= 0.1
+CHAR_TABLE = bytes(
+    ord(ASCII_CHARS[int(v / 255 * (len(ASCII_CHARS) - 1))]) if v / 255 > 0.1 else ord(" ")
+    for v in range(256)
+)
+
+# Colors per frame: the black hole has little chroma variance, so a small
+# adaptive palette looks the same and lets long runs share one style
+PALETTE_SIZE = 32
+
+
+def _palette_styles(palette: list[int]) -> list[Style]:
+    """Build one Style per entry of a flat [r, g, b, r, g, b, ...] palette."""
+    return [
+        Style(color=f"rgb({palette[i]},{palette[i + 1]},{palette[i + 2]})")
+        for i in range(0, len(palette), 3)
+    ]
+
+
+def _frame_to_text(frame) -> Text:
+    """Convert a resized RGB frame to colored ASCII art.
+
+    Brightness and character selection run in bulk (PIL luma conversion and
+    ``bytes.translate``). Colors are reduced to an adaptive palette (median
+    cut) so each cell is a palette index, and adjacent cells sharing an
+    index are appended as one span.
+    """
+    width, height = frame.size
+    # PIL's "L" mode uses the same ITU-R 601 weights (0.299, 0.587, 0.114)
+    chars = frame.convert("L").tobytes().translate(CHAR_TABLE).decode("ascii")
+    quantized = frame.quantize(colors=PALETTE_SIZE)
+    indices = quantized.tobytes()
+    styles = _palette_styles(quantized.getpalette()[:3 * PALETTE_SIZE])
+
+    text = Text()
+    for y in range(height):
+        start = y * width
+        run_start = start
+        run_index = -1
+        for i in range(start, start + width):
+            index = indices[i] if chars[i] != " " else -1
+            if index != run_index:
+                if i > run_start:
+                    text.append(chars[run_start:i], style=styles[run_index] if run_index >= 0 else None)
+                run_start = i
+                run_index = index
+        text.append(chars[run_start:start + width], style=styles[run_index] if run_index >= 0 else None)
+        text.append("\n")
+    return text
+
 
 async def gif_animation(console: Console) -> None:
     """Display black hole spinning animation (5 seconds).
@@ -29,69 +96,64 @@ async def gif_animation(console: Console) -> None:
     """
     try:
         from PIL import Image
-        import requests
     except ImportError:
         console.print()
-        console.print("[yellow]This animation requires PIL and requests packages.[/yellow]")
-        console.print("[dim]Install with: pip install pillow requests[/dim]")
+        console.print("[yellow]This animation requires the PIL package.[/yellow]")
+        console.print("[dim]Install with: pip install pillow[/dim]")
         console.print()
         return
     
+    import hashlib
     import io
-    
-    # ASCII characters from dark to bright
-    ASCII_CHARS = ' .:-=+*#%@'
-    GIF_URL = "https://images.steamusercontent.com/ugc/480020637383985059/4AF1AFCA793CFFD924E6F880918F0DD181593552/"
+    from urllib.error import URLError
     
     console.print()
     console.print("[dim]Loading black hole animation...[/dim]")
     
     try:
-        # Download the GIF
-        response = requests.get(GIF_URL, timeout=10)
-        response.raise_for_status()
-        gif_data = io.BytesIO(response.content)
-        
-        # Open with PIL
-        gif = Image.open(gif_data)
+        # Download the GIF (cached on disk after the first run)
+        gif_bytes = fetch_cached(BLACKHOLE_GIF_URL, BLACKHOLE_GIF_NAME, timeout=10)
         
         # Get terminal size
         term_size = shutil.get_terminal_size()
         width = min(70, term_size.columns - 4)
         height = min(18, term_size.lines - 4)
         
-        # Extract frames
-        frames = []
-        try:
-            while True:
-                # Convert frame to RGB
-                frame = gif.convert('RGB')
-                
-                # Resize to fit terminal
-                frame = frame.resize((width, height), Image.Resampling.LANCZOS)
-                
-                # Convert to Rich Text with colors
-                text = Text()
-                for y in range(height):
-                    for x in range(width):
-                        pixel = frame.getpixel((x, y))
-                        r, g, b = pixel
-                        # Calculate brightness
-                        brightness = (r * 0.299 + g * 0.587 + b * 0.114) / 255
-                        char_idx = int(brightness * (len(ASCII_CHARS) - 1))
-                        char = ASCII_CHARS[char_idx]
-                        
-                        if brightness > 0.1:
-                            # Use RGB color
-                            text.append(char, style=f"rgb({r},{g},{b})")
-                        else:
-                            text.append(" ")
-                    text.append("\n")
-                
-                frames.append(text)
-                gif.seek(gif.tell() + 1)
-        except EOFError:
-            pass  # End of frames
+        # Extracted frames are deterministic for a given GIF and size
+        gif_hash = hashlib.sha1(gif_bytes).hexdigest()[:12]  # noqa: S324 - cache key only
+        frames_name = f"blackhole_frames_v{FRAMES_CACHE_VERSION}_{width}x{height}_{gif_hash}.pkl"
+        frames = load_cached_object(frames_name)
+        
+        if frames is None:
+            # Open with PIL
+            gif = Image.open(io.BytesIO(gif_bytes))
+            
+            # Only extract the frames a playback can show, sampled evenly
+            n_frames = getattr(gif, "n_frames", 1)
+            if n_frames > MAX_FRAMES:
+                indices = [i * n_frames // MAX_FRAMES for i in range(MAX_FRAMES)]
+            else:
+                indices = range(n_frames)
+            
+            # Extract frames
+            frames = []
+            try:
+                for index in indices:
+                    gif.seek(index)
+                    
+                    # Convert frame to RGB
+                    frame = gif.convert('RGB')
+                    
+                    # Resize to fit terminal
+                    frame = frame.resize((width, height), Image.Resampling.LANCZOS)
+                    
+                    # Convert to Rich Text with colors
+                    frames.append(_frame_to_text(frame))
+            except EOFError:
+                pass  # End of frames
+            
+            if frames:
+                save_cached_object(frames_name, frames)
         
         if not frames:
             console.print("[red]Could not extract frames from GIF[/red]")
@@ -99,25 +161,22 @@ async def gif_animation(console: Console) -> None:
         
         console.print()
         
-        # Run for 5 seconds
-        start_time = time.time()
-        duration = 5.0
+        # Run for 5 seconds at ~12 fps, looping shorter GIFs
+        # Consecutive identical frames share one panel so they are not pushed again
+        panels = []
+        for i, frame in enumerate(frames):
+            if i and frame == frames[i - 1]:
+                panels.append(panels[-1])
+            else:
+                panels.append(Panel(frame, border_style=STYLE_PRIMARY, title=" Black Hole "))
+        if len(panels) > 1 and frames[-1] == frames[0]:
+            panels[-1] = panels[0]
         
-        with raw_terminal(), Live(console=console, refresh_per_second=12, transient=True) as live:
-            while time.time() - start_time < duration:
-                if check_escape_pressed():
-                    break
-                for i, frame in enumerate(frames):
-                    if check_escape_pressed():
-                        break
-                    if time.time() - start_time >= duration:
-                        break
-                    live.update(Panel(frame, border_style=STYLE_PRIMARY, title=" Black Hole "))
-                    await asyncio.sleep(0.083)  # ~12 fps
+        await run_frames(console, panels, fps=FPS, duration=DURATION)
                     
     except Exception as e:
-        # Handle requests.RequestException and other errors
-        if "requests" in str(type(e).__module__):
+        # Handle download errors and other errors
+        if isinstance(e, (URLError, TimeoutError)):
             console.print(f"[red]Could not download animation: {e}[/red]")
         else:
             console.print(f"[red]Animation error: {e}[/red]")
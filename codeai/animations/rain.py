@@ -4,16 +4,46 @@
 
 """Matrix rain animation for Code AI TUX."""
 
-import asyncio
+import itertools
 import random
 import shutil
-import time
+from typing import Iterator
 
 from rich.console import Console
-from rich.live import Live
-from rich.text import Text
 
-from .utils import raw_terminal, check_escape_pressed
+from .utils import play, raw_terminal
+
+
+# Longest trail a column can have
+MAX_TRAIL = 15
+
+# Terminal control sequences
+ALT_SCREEN_ON = "\x1b[?1049h\x1b[?25l"  # Switch to the alternate screen, hide cursor
+ALT_SCREEN_OFF = "\x1b[0m\x1b[?25h\x1b[?1049l"  # Reset colors, show cursor, back to the main screen
+CURSOR_HOME = "\x1b[H"
+
+# ANSI colors of a trail, brightest at head, dimmer down trail:
+# bold bright_green, green, dark_green, dim green
+TRAIL_COLORS = ("\x1b[0;1;92m", "\x1b[0;32m", "\x1b[0;38;5;22m", "\x1b[0;2;32m")
+
+# Color of a cell by its distance from the column head
+DIST_COLORS = tuple(
+    TRAIL_COLORS[0] if dist <= 1
+    else TRAIL_COLORS[1] if dist <= 3
+    else TRAIL_COLORS[2] if dist <= 6
+    else TRAIL_COLORS[3]
+    for dist in range(MAX_TRAIL + 4)
+)
+
+
+def _column_resets(batch: int = 64) -> Iterator[tuple[int, int, int]]:
+    """Yield new (position, speed, trail) column states, drawn in batches."""
+    while True:
+        yield from zip(
+            random.choices(range(-10, 1), k=batch),
+            random.choices(range(1, 4), k=batch),
+            random.choices(range(5, MAX_TRAIL + 1), k=batch),
+        )
 
 
 async def rain_animation(console: Console) -> None:
@@ -30,71 +60,78 @@ async def rain_animation(console: Console) -> None:
     # Matrix characters
     chars = "ﾊﾐﾋｰｳｼﾅﾓﾆｻﾜﾂｵﾘｱﾎﾃﾏｹﾒｴｶｷﾑﾕﾗｾﾈｽﾀﾇﾍ01234567890"
     
-    # Columns state: each column has (position, speed, char_list)
-    columns = []
-    for _ in range(width):
-        # Random start position (negative = delayed start)
-        pos = random.randint(-height, 0)
-        speed = random.randint(1, 3)
-        trail_len = random.randint(5, 15)
-        columns.append({"pos": pos, "speed": speed, "trail": trail_len})
+    # Columns state as parallel lists (struct of arrays): head position,
+    # speed and trail length, indexed by column
+    # Random start position (negative = delayed start)
+    pos = [random.randint(-height, 0) for _ in range(width)]
+    speed = [random.randint(1, 3) for _ in range(width)]
+    trail = [random.randint(5, MAX_TRAIL) for _ in range(width)]
+    resets = _column_resets()
     
-    console.print()
+    # Frame grid, allocated once and blanked in place on every frame
+    grid = [[" "] * width for _ in range(height)]
+    blank_row = [" "] * width
+    last_dist = len(DIST_COLORS) - 1
     
-    # Run for 5 seconds
-    start_time = time.time()
-    duration = 5.0
+    out = console.file
+    
+    console.print()
     
     try:
-        with raw_terminal(), Live(console=console, refresh_per_second=15, transient=True) as live:
-            while time.time() - start_time < duration:
-                if check_escape_pressed():
-                    break
-                
-                # Build frame
-                grid = [[" " for _ in range(width)] for _ in range(height)]
-                
-                for col_idx, col in enumerate(columns):
-                    head_pos = col["pos"]
-                    trail_len = col["trail"]
+        with raw_terminal() as escape:
+            # Draw straight to the alternate screen: one pre-joined write per
+            # frame instead of going through Rich's render and diff pipeline
+            out.write(ALT_SCREEN_ON)
+            out.flush()
+            try:
+                # Run for 5 seconds at ~15 fps, simulating one step per frame
+                async for _ in play(itertools.repeat(None), fps=15, duration=5.0, escape=escape):
+                    # Build frame
+                    for grid_row in grid:
+                        grid_row[:] = blank_row
+                    
+                    # Draw all the characters needed by this frame in one call,
+                    # each column reading from its own MAX_TRAIL-long slice
+                    pool = random.choices(chars, k=width * MAX_TRAIL)
                     
-                    for i in range(trail_len):
-                        row = head_pos - i
-                        if 0 <= row < height:
-                            char = random.choice(chars)
-                            grid[row][col_idx] = char
+                    for col_idx in range(width):
+                        head_pos = pos[col_idx]
+                        
+                        # Only visit the rows of the trail that are on screen
+                        first = max(0, head_pos - trail[col_idx] + 1)
+                        offset = col_idx * MAX_TRAIL - first
+                        for row in range(first, min(height, head_pos + 1)):
+                            grid[row][col_idx] = pool[offset + row]
+                        
+                        # Move column down
+                        pos[col_idx] = head_pos = head_pos + speed[col_idx]
+                        
+                        # Reset when off screen
+                        if head_pos - trail[col_idx] > height:
+                            pos[col_idx], speed[col_idx], trail[col_idx] = next(resets)
                     
-                    # Move column down
-                    col["pos"] += col["speed"]
+                    # Render rows with a color escape only where the color changes
+                    # (blanks don't care which color is active)
+                    rows = []
+                    for row_idx, row in enumerate(grid):
+                        parts = []
+                        color = None
+                        for col_idx, char in enumerate(row):
+                            if char != " ":
+                                # Columns reset this frame sit above the screen: treat as head
+                                dist = max(0, min(pos[col_idx] - row_idx, last_dist))
+                                cell_color = DIST_COLORS[dist]
+                                if cell_color is not color:
+                                    parts.append(cell_color)
+                                    color = cell_color
+                            parts.append(char)
+                        rows.append("".join(parts))
                     
-                    # Reset when off screen
-                    if col["pos"] - col["trail"] > height:
-                        col["pos"] = random.randint(-10, 0)
-                        col["speed"] = random.randint(1, 3)
-                        col["trail"] = random.randint(5, 15)
-                
-                # Render with colors
-                text = Text()
-                for row_idx, row in enumerate(grid):
-                    for col_idx, char in enumerate(row):
-                        if char != " ":
-                            # Brightest at head, dimmer down trail
-                            col = columns[col_idx]
-                            dist_from_head = col["pos"] - row_idx
-                            if dist_from_head <= 1:
-                                text.append(char, style="bold bright_green")
-                            elif dist_from_head <= 3:
-                                text.append(char, style="green")
-                            elif dist_from_head <= 6:
-                                text.append(char, style="dark_green")
-                            else:
-                                text.append(char, style="dim green")
-                        else:
-                            text.append(" ")
-                    text.append("\n")
-                
-                live.update(text)
-                await asyncio.sleep(0.066)  # ~15 fps
+                    out.write(CURSOR_HOME + "\n".join(rows))
+                    out.flush()
+            finally:
+                out.write(ALT_SCREEN_OFF)
+                out.flush()
     except KeyboardInterrupt:
         pass
     
@@ -4,34 +4,158 @@
 
 """Utility functions for animations."""
 
+import asyncio
+import itertools
+import math
+import os
 import sys
-import select
 import termios
 import tty
 from contextlib import contextmanager
-from typing import Generator
+from collections import deque
+from typing import AsyncIterator, Callable, Generator, Iterable, Optional, TypeVar
+
+
+ESCAPE = b'\x1b'
+
+T = TypeVar("T")
+
+
+def _on_stdin(fd: int, escape: asyncio.Event) -> None:
+    """Drain pending keystrokes and flag the event if ESCAPE was pressed."""
+    try:
+        data = os.read(fd, 64)
+    except (BlockingIOError, InterruptedError):
+        return
+    if ESCAPE in data:
+        escape.set()
 
 
 @contextmanager
-def raw_terminal() -> Generator[None, None, None]:
-    """Context manager to put terminal in raw mode for key detection."""
+def raw_terminal() -> Generator[asyncio.Event, None, None]:
+    """Context manager to put terminal in raw mode for key detection.
+
+    Stdin is registered with the running event loop, so keystrokes are only
+    read when they arrive instead of being polled on every frame. Must be
+    entered from a coroutine.
+
+    Yields:
+        An event that gets set as soon as ESCAPE is pressed.
+    """
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
+    loop = asyncio.get_running_loop()
+    escape = asyncio.Event()
     try:
         tty.setcbreak(fd)
-        yield
+        loop.add_reader(fd, _on_stdin, fd, escape)
+        yield escape
     finally:
+        loop.remove_reader(fd)
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 
-def check_escape_pressed() -> bool:
-    """Check if ESCAPE key was pressed (non-blocking).
-    
+async def play(
+    frames: Iterable[T],
+    fps: float,
+    duration: Optional[float] = None,
+    escape: Optional[asyncio.Event] = None,
+) -> AsyncIterator[T]:
+    """Yield frames on a fixed, monotonic schedule.
+
+    Each frame is due at ``start + n / fps``, so the time spent rendering a
+    frame is absorbed by the next sleep instead of accumulating as drift.
+    When rendering falls more than one interval behind, late frames are
+    dropped rather than played back in a burst.
+
+    Args:
+        frames: Frames to play. With a ``duration`` they are cycled.
+        fps: Target frames per second.
+        duration: Stop after this many seconds; play the frames once if None.
+        escape: Stop as soon as this event is set.
+
+    Yields:
+        The frames that are due, in order.
+    """
+    loop = asyncio.get_running_loop()
+    interval = 1.0 / fps
+    next_t = start = loop.time()
+    end = None if duration is None else start + duration
+    source = itertools.cycle(frames) if duration is not None else iter(frames)
+
+    for frame in source:
+        now = loop.time()
+        if end is not None and now >= end:
+            break
+        if escape is not None and escape.is_set():
+            break
+        if now > next_t + interval:
+            # Too far behind: drop this frame and catch up
+            next_t += interval
+            continue
+        yield frame
+        next_t += interval
+        await asyncio.sleep(max(0.0, next_t - loop.time()))
+
+
+def timeline(frames: Iterable[T], fps: float, duration: Optional[float] = None) -> list[tuple[T, float]]:
+    """Lay out frames as (frame, delay) pairs for :func:`run_timeline`.
+
+    Args:
+        frames: Frames to show. With a ``duration`` they are cycled.
+        fps: Frames per second.
+        duration: Cycle the frames for this many seconds; show them once if None.
+
     Returns:
-        True if ESCAPE was pressed, False otherwise.
+        The frames, each with the time it stays on screen.
     """
-    if select.select([sys.stdin], [], [], 0)[0]:
-        char = sys.stdin.read(1)
-        if char == '\x1b':  # ESCAPE character
-            return True
-    return False
+    interval = 1.0 / fps
+    if duration is None:
+        return [(frame, interval) for frame in frames]
+    count = math.ceil(duration * fps)
+    return [(frame, interval) for frame in itertools.islice(itertools.cycle(frames), count)]
+
+
+async def run_timeline(
+    frames: Iterable[tuple[T, float]],
+    show: Callable[[T], None],
+    escape: Optional[asyncio.Event] = None,
+) -> None:
+    """Show precomputed (frame, delay) pairs from a chain of loop callbacks.
+
+    A single timer is pending at any time and no coroutine is resumed per
+    frame. Deadlines accumulate from the start time so the playback does
+    not drift, and frames that are already more than their own delay late
+    are skipped.
+
+    Args:
+        frames: Frames with the time each stays on screen.
+        show: Called with each frame when it is due.
+        escape: Stop as soon as this event is set.
+    """
+    loop = asyncio.get_running_loop()
+    queue = deque(frames)
+    done = loop.create_future()
+    handle: Optional[asyncio.TimerHandle] = None
+    due = loop.time()
+
+    def _tick() -> None:
+        nonlocal handle, due
+        while queue:
+            if escape is not None and escape.is_set():
+                break
+            frame, delay = queue.popleft()
+            late = loop.time() > due + delay
+            due += delay
+            if not late:
+                show(frame)
+                handle = loop.call_at(due, _tick)
+                return
+        if not done.done():
+            done.set_result(None)
+
+    handle = loop.call_soon(_tick)
+    try:
+        await done
+    finally:
+        handle.cancel()
@@ -5,17 +5,13 @@
 """Banner and animation utilities for Code AI CLI."""
 
 import io
+import operator
+import queue
 import random
 import sys
+import threading
 import time
 
-try:
-    from PIL import Image
-    import requests
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-
 # ANSI color codes - Datalayer brand colors
 # Using True Color (24-bit) for precise color matching
 #
@@ -48,6 +44,9 @@ BOLD = '\033[1m'
 DIM = '\033[2m'
 RESET = '\033[0m'
 
+# Clear the screen and move to top-left, in one sequence
+CLEAR_HOME = '\033[2J\033[H'
+
 # Goodbye message displayed on exit
 GOODBYE_MESSAGE = '✨ Thank you for using Code AI. See you soon!'
 
@@ -55,11 +54,14 @@ GOODBYE_MESSAGE = '✨ Thank you for using Code AI. See you soon!'
 BANNER = f"""
 {GREEN_DARK}{BOLD}╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
-║   {GREEN_LIGHT}░█▀▀░█▀█░█▀▄░█▀▀░█▀█░▀█▀  {WHITE}AI-Powered Data Assistant         {GREEN_DARK}║
+║   {GREEN_LIGHT}░█▀▀░█▀█░█▀▄░█▀▀░█▀█░▀█▀  \
+{WHITE}AI-Powered Data Assistant         {GREEN_DARK}║
 ║   {GREEN_LIGHT}░█░░░█░█░█░█░█▀▀░█▀█░░█░  {WHITE}Cheaper • Faster • Collaborative  {GREEN_DARK}║
-║   {GREEN_LIGHT}░▀▀▀░▀▀▀░▀▀░░▀▀▀░▀░▀░▀▀▀  {GREEN_DARK}                                  {GREEN_DARK}║
+║   {GREEN_LIGHT}░▀▀▀░▀▀▀░▀▀░░▀▀▀░▀░▀░▀▀▀  \
+{GREEN_DARK}                                  {GREEN_DARK}║
 ║                                                               ║
-║   {GREEN_DARK}✨ Data Analysis  {GREEN_MEDIUM}📊 Data Science  {GREEN_LIGHT}📓 Software Development  {GREEN_DARK}║
+║   {GREEN_DARK}✨ Data Analysis  {GREEN_MEDIUM}📊 Data Science  \
+{GREEN_LIGHT}📓 Software Development  {GREEN_DARK}║
 ║                                                               ║
 ║   {GRAY}Type /exit to quit  •  Type / for commands                  {GREEN_DARK}║
 ╚═══════════════════════════════════════════════════════════════╝{RESET}
@@ -68,8 +70,123 @@ BANNER = f"""
 # Matrix-style characters for the rain effect
 MATRIX_CHARS = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ0123456789@#$%&*"
 
+# Same characters as a tuple, for bulk sampling with random.choices()
+_MATRIX_CHARS_TUPLE = tuple(MATRIX_CHARS)
+
+# ASCII characters from dark to bright, for the spinning animation
+ASCII_CHARS = ' .:-=+*#%@'
+
+# Luma (0-255) to ASCII character, blank for pixels with brightness <= 0.1
+_ASCII_TABLE = bytes(
+    ord(ASCII_CHARS[int(v / 255 * (len(ASCII_CHARS) - 1))]) if v / 255 > 0.1 else ord(' ')
+    for v in range(256)
+)
+
+# Per-channel contributions to the 256-color cube index
+# 16 + 36 * r/51 + 6 * g/51 + b/51 (always <= 231, so the sum fits a byte)
+_CUBE_RED = [16 + 36 * min(5, v // 51) for v in range(256)]
+_CUBE_GREEN = [6 * min(5, v // 51) for v in range(256)]
+_CUBE_BLUE = [min(5, v // 51) for v in range(256)]
+
+# SGR sequence selecting each 256-color foreground
+_COLOR_PREFIX = tuple(f'\033[38;5;{c}m' for c in range(256))
+
+# Bump when the spinning animation rendering changes to invalidate cached frames
+SPINNING_FRAMES_VERSION = 1
+
+# Matrix trail colors, each a complete SGR sequence (leading 0 resets the
+# previous attributes) so consecutive cells only need one when it changes
+MATRIX_HEAD = '\033[0;1;97m'    # Bright white (head)
+MATRIX_NEAR = '\033[0;1;92m'    # Bright green
+MATRIX_MID = '\033[0;32m'       # Normal green
+MATRIX_TAIL = '\033[0;2;32m'    # Dim green
+
+# Longest trail of a matrix column
+MATRIX_MAX_LENGTH = 10
+
+# Color of each trail position: head is bright white-green, tail fades to dark green
+_MATRIX_TRAIL_COLORS = (
+    MATRIX_HEAD,
+    MATRIX_NEAR,
+    MATRIX_MID,
+    MATRIX_MID,
+    *(MATRIX_TAIL,) * (MATRIX_MAX_LENGTH - 4),
+)
+
+
+# Whether stdout is a terminal, checked once at import (see _refresh_tty)
+_IS_TTY = False
+
+
+def _refresh_tty() -> bool:
+    """Re-check whether stdout is a terminal, e.g. after ``sys.stdout`` was replaced."""
+    global _IS_TTY
+    _IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+    return _IS_TTY
+
+
+_refresh_tty()
+
+
+def _write_frame(frame: bytes) -> None:
+    """Write an encoded frame straight to stdout's binary buffer and flush it.
 
-def matrix_rain_banner(width: int = 60, height: int = 12, duration: float = 2.0, fps: int = 15, start_row: int = 0) -> None:
+    Skips the text layer's encoding for every frame; falls back to a text
+    write when stdout has no binary buffer (e.g. when replaced in tests).
+    """
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(frame.decode('utf-8'))
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()  # Keep ordering with text written before
+    buffer.write(frame)
+    buffer.flush()
+
+
+class _FrameWriter:
+    """Write frames to the terminal from a background thread.
+    
+    Building the next frame overlaps with writing the previous one. The
+    queue holds at most two frames, so the producer blocks (and is naturally
+    throttled) when the terminal can't keep up.
+    """
+    
+    def __init__(self) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=2)
+        self._thread = threading.Thread(target=self._run, name='codeai-frame-writer', daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            try:
+                _write_frame(frame)
+            except OSError:
+                pass  # Keep draining so the producer never blocks
+    
+    def write(self, frame: bytes) -> None:
+        """Queue an encoded frame for writing."""
+        self._queue.put(frame)
+    
+    def close(self) -> None:
+        """Wait until every queued frame has been written."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+def _sleep_until(deadline: float) -> None:
+    """Sleep until the ``time.monotonic()`` deadline, not at all if it already passed."""
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def matrix_rain_banner(
+    width: int = 60, height: int = 12, duration: float = 2.0, fps: int = 15, start_row: int = 0
+) -> None:
     """Display an animated Matrix-style digital rain effect.
     
     Args:
@@ -79,18 +196,15 @@ def matrix_rain_banner(width: int = 60, height: int = 12, duration: float = 2.0,
         fps: Frames per second for the animation
         start_row: Row to start drawing from (to preserve content above)
     """
-    if not sys.stdout.isatty():
+    if not _IS_TTY:
         return
     
-    # Initialize columns with random starting positions and speeds
-    columns = []
-    for x in range(width):
-        columns.append({
-            'y': random.randint(-height, 0),
-            'speed': random.uniform(0.3, 1.0),
-            'chars': [random.choice(MATRIX_CHARS) for _ in range(height + 5)],
-            'length': random.randint(4, 10)
-        })
+    # Initialize columns with random starting positions and speeds, as
+    # parallel lists (struct of arrays) indexed by column
+    col_y = [random.randint(-height, 0) for _ in range(width)]
+    col_speed = [random.uniform(0.3, 1.0) for _ in range(width)]
+    col_chars = [random.choices(_MATRIX_CHARS_TUPLE, k=height + 5) for _ in range(width)]
+    col_length = [random.randint(4, MATRIX_MAX_LENGTH) for _ in range(width)]
     
     # Hide cursor, move to start position (don't clear screen to preserve banner)
     sys.stdout.write('\033[?25l')  # Hide cursor
@@ -100,171 +214,261 @@ def matrix_rain_banner(width: int = 60, height: int = 12, duration: float = 2.0,
     frame_delay = 1.0 / fps
     frames = int(duration * fps)
     
+    # Flat frame grids (indexed y * width + x), allocated once and blanked
+    # in place on every frame
+    size = width * height
+    screen = [' '] * size
+    colors = [''] * size
+    blank_screen = [' '] * size
+    blank_colors = [''] * size
+    
+    # What the terminal shows from the previous frame; None forces the first
+    # frame to be drawn in full
+    prev_screen = [None] * size
+    prev_colors = [None] * size
+    
+    # Frames are paced against a monotonic deadline so render time doesn't add up
+    deadline = time.monotonic()
+    writer = _FrameWriter()
+    
     try:
         for frame in range(frames):
-            # Build the frame
-            screen = [[' ' for _ in range(width)] for _ in range(height)]
-            colors = [['' for _ in range(width)] for _ in range(height)]
+            # Build the frame, reusing the grids of the frame before last
+            screen[:] = blank_screen
+            colors[:] = blank_colors
             
-            for x, col in enumerate(columns):
-                head_y = int(col['y'])
+            heads = list(map(int, col_y))
+            for x in range(width):
+                head_y = heads[x]
+                length = col_length[x]
+                chars = col_chars[x]
                 
                 # Draw the trail
-                for i in range(col['length']):
+                for i in range(length):
                     y = head_y - i
                     if 0 <= y < height:
-                        char_idx = (y + frame) % len(col['chars'])
-                        screen[y][x] = col['chars'][char_idx]
-                        
-                        # Head is bright white-green, tail fades to dark green
-                        if i == 0:
-                            colors[y][x] = '\033[1;97m'  # Bright white (head)
-                        elif i == 1:
-                            colors[y][x] = '\033[1;92m'  # Bright green
-                        elif i < 4:
-                            colors[y][x] = '\033[0;32m'  # Normal green
-                        else:
-                            colors[y][x] = '\033[2;32m'  # Dim green
-                
-                # Move column down
-                col['y'] += col['speed']
-                
-                # Reset column when it goes off screen
-                if head_y - col['length'] > height:
-                    col['y'] = random.randint(-10, -1)
-                    col['speed'] = random.uniform(0.3, 1.0)
-                    col['length'] = random.randint(4, 10)
-                    col['chars'] = [random.choice(MATRIX_CHARS) for _ in range(height + 5)]
+                        char_idx = (y + frame) % len(chars)
+                        idx = y * width + x
+                        screen[idx] = chars[char_idx]
+                        colors[idx] = _MATRIX_TRAIL_COLORS[i]
             
-            # Render frame
-            output = []
-            for y in range(height):
-                row = ''
-                for x in range(width):
-                    if colors[y][x]:
-                        row += colors[y][x] + screen[y][x] + RESET
-                    else:
-                        row += screen[y][x]
-                output.append(row)
+            # Move all columns down at once
+            col_y[:] = map(operator.add, col_y, col_speed)
             
-            # Move cursor to start position and draw
-            sys.stdout.write(f'\033[{start_row + 1};1H')  # Move to start row
-            sys.stdout.write('\n'.join(output))
-            sys.stdout.write('\n')
-            sys.stdout.flush()
+            # Reset the columns that went off screen, drawing their new state in bulk
+            reset = [x for x in range(width) if heads[x] - col_length[x] > height]
+            if reset:
+                for x, y, length in zip(
+                    reset,
+                    random.choices(range(-10, 0), k=len(reset)),
+                    random.choices(range(4, MATRIX_MAX_LENGTH + 1), k=len(reset)),
+                ):
+                    col_y[x] = y
+                    col_speed[x] = random.uniform(0.3, 1.0)
+                    col_length[x] = length
+                    col_chars[x] = random.choices(_MATRIX_CHARS_TUPLE, k=height + 5)
+            
+            # Render only the cells that changed since the previous frame into
+            # one buffer, written with a single call. The cursor is moved only
+            # when the next changed cell isn't right after the last one written,
+            # and a color is only emitted when it changes (blanks keep the
+            # current one).
+            buf = []
+            cursor = -1
+            current = ''
+            for idx in range(size):
+                char = screen[idx]
+                color = colors[idx]
+                if char == prev_screen[idx] and color == prev_colors[idx]:
+                    continue
+                if idx != cursor:
+                    y, x = divmod(idx, width)
+                    buf.append(f'\033[{start_row + 1 + y};{x + 1}H')
+                if color and color != current:
+                    buf.append(color)
+                    current = color
+                buf.append(char)
+                # Don't rely on the cursor wrapping at the end of a row
+                cursor = idx + 1 if (idx + 1) % width else -1
+            if current:
+                buf.append(RESET)
+            if buf:
+                writer.write(''.join(buf).encode('utf-8'))
             
-            time.sleep(frame_delay)
+            # The frame just drawn is what the terminal shows now, and the
+            # previous grids get reused for the next frame
+            screen, prev_screen = prev_screen, screen
+            colors, prev_colors = prev_colors, colors
+            
+            deadline += frame_delay
+            _sleep_until(deadline)
         
         # Fade out effect - gradually reduce characters
+        fade_population = (*_MATRIX_CHARS_TUPLE, ' ')
         for fade_frame in range(5):
-            sys.stdout.write(f'\033[{start_row + 1};1H')  # Move to start row
-            for y in range(height):
-                row = ''
-                for x in range(width):
-                    if random.random() > (fade_frame + 1) / 6:
-                        row += f'\033[2;32m{random.choice(MATRIX_CHARS)}{RESET}'
-                    else:
-                        row += ' '
-                sys.stdout.write(row + '\n')
-            sys.stdout.flush()
-            time.sleep(0.05)
+            # Draw every cell of the frame in one call: a blank with the fade
+            # probability, otherwise any matrix character with equal chance
+            blank = (fade_frame + 1) / 6
+            weights = [(1 - blank) / len(_MATRIX_CHARS_TUPLE)] * len(_MATRIX_CHARS_TUPLE) + [blank]
+            cells = random.choices(fade_population, weights=weights, k=width * height)
+            buf = [f'\033[{start_row + 1};1H']  # Move to start row
+            for start in range(0, width * height, width):
+                buf.append(MATRIX_TAIL)
+                buf.append(''.join(cells[start:start + width]))
+                buf.append(RESET)
+                buf.append('\n')
+            writer.write(''.join(buf).encode('utf-8'))
+            deadline += 0.05
+            _sleep_until(deadline)
     
     finally:
-        # Show cursor and clear just the animation area
-        sys.stdout.write('\033[?25h')  # Show cursor
-        # Clear the animation area by writing spaces
-        sys.stdout.write(f'\033[{start_row + 1};1H')  # Move to start row
-        for _ in range(height + 1):
-            sys.stdout.write(' ' * width + '\n')
-        sys.stdout.write(f'\033[{start_row + 1};1H')  # Move back to start row
+        writer.close()
+        # Show cursor and clear just the animation area by writing spaces
+        # over it, then move back to start row, all in one write
+        move = f'\033[{start_row + 1};1H'
+        sys.stdout.write('\033[?25h' + move + (' ' * width + '\n') * (height + 1) + move)
         sys.stdout.flush()
 
 
-def spinning_animation(width: int = 70, height: int = 20, duration: float = 3.0, fps: int = 10) -> None:
+# Whether PIL can be imported, probed on first use (see _has_pil)
+_HAS_PIL = None
+
+
+def _has_pil() -> bool:
+    """Check once whether PIL is installed, without importing it."""
+    global _HAS_PIL
+    if _HAS_PIL is None:
+        import importlib.util
+        _HAS_PIL = importlib.util.find_spec('PIL') is not None
+    return _HAS_PIL
+
+
+def _spinning_frames(gif_data: bytes, width: int, height: int) -> list:
+    """Convert every frame of the GIF to a ready-to-write ASCII art frame.
+    
+    Args:
+        gif_data: Content of the GIF file
+        width: Width of the frames in characters
+        height: Height of the frames in rows
+    
+    Returns:
+        The encoded frames.
+    """
+    # PIL is only needed here, so it's imported on the first splash that
+    # isn't served from the frame cache
+    from PIL import Image, ImageChops
+    
+    # Open with PIL
+    gif = Image.open(io.BytesIO(gif_data))
+    
+    # Extract frames
+    frames = []
+    try:
+        while True:
+            # Convert frame to RGB then to grayscale
+            frame = gif.convert('RGB')
+            
+            # Resize to fit terminal (width x height, accounting for char aspect ratio)
+            frame = frame.resize((width, height), Image.Resampling.LANCZOS)
+            
+            # Convert to ASCII with whole-image operations: luma through a
+            # character table, and the 256-color index summed per channel
+            chars = frame.convert('L').tobytes().translate(_ASCII_TABLE).decode('ascii')
+            red, green, blue = frame.split()
+            codes = ImageChops.add(
+                ImageChops.add(red.point(_CUBE_RED), green.point(_CUBE_GREEN)),
+                blue.point(_CUBE_BLUE),
+            ).tobytes()
+            
+            # Emit a color only when it changes between visible characters
+            ascii_frame = []
+            for start in range(0, width * height, width):
+                row = []
+                current = None
+                for idx in range(start, start + width):
+                    char = chars[idx]
+                    if char != ' ' and codes[idx] != current:
+                        current = codes[idx]
+                        row.append(_COLOR_PREFIX[current])
+                    row.append(char)
+                if current is not None:
+                    row.append(RESET)
+                ascii_frame.append(''.join(row))
+            
+            # Store each frame as one encoded string, preceded by
+            # cursor-home, so playback is a single write with no per-frame work
+            frames.append(('\033[H' + '\n'.join(ascii_frame)).encode('utf-8'))
+            gif.seek(gif.tell() + 1)
+    except EOFError:
+        pass  # End of frames
+    
+    return frames
+
+
+def spinning_animation(
+    width: int = 70,
+    height: int = 20,
+    duration: float = 3.0,
+    fps: int = 10,
+    clear_screen: bool = True,
+) -> None:
     """Display an animated black hole GIF converted to ASCII art.
     
     Downloads a spinning black hole GIF and renders it as animated ASCII art
-    using PIL for image processing.
+    using PIL for image processing. The rendered frames are cached on disk
+    per size, so later runs need neither the network nor PIL.
     
     Args:
         width: Width of the display in characters
         height: Height of the display in rows
         duration: How long to show the animation in seconds
         fps: Frames per second for the animation
+        clear_screen: Clear the screen before and after the animation. Pass
+            False when the screen is already blank and the caller redraws it.
     """
-    if not sys.stdout.isatty() or not HAS_PIL:
+    if not _IS_TTY:
         return
     
-    # ASCII characters from dark to bright
-    ASCII_CHARS = ' .:-=+*#%@'
+    from codeai.animations.assets import (
+        BLACKHOLE_GIF_NAME,
+        BLACKHOLE_GIF_URL,
+        fetch_cached,
+        load_cached_object,
+        save_cached_object,
+    )
     
-    GIF_URL = "https://images.steamusercontent.com/ugc/480020637383985059/4AF1AFCA793CFFD924E6F880918F0DD181593552/"
+    frames_name = f"blackhole_ascii_v{SPINNING_FRAMES_VERSION}_{width}x{height}.pkl.gz"
+    frames = load_cached_object(frames_name)
+    if frames is None and not _has_pil():
+        return
     
     try:
-        # Download the GIF
-        response = requests.get(GIF_URL, timeout=5)
-        response.raise_for_status()
-        gif_data = io.BytesIO(response.content)
-        
-        # Open with PIL
-        gif = Image.open(gif_data)
-        
-        # Extract frames
-        frames = []
-        try:
-            while True:
-                # Convert frame to RGB then to grayscale
-                frame = gif.convert('RGB')
-                
-                # Resize to fit terminal (width x height, accounting for char aspect ratio)
-                frame = frame.resize((width, height), Image.Resampling.LANCZOS)
-                
-                # Convert to ASCII
-                ascii_frame = []
-                for y in range(height):
-                    row = ''
-                    for x in range(width):
-                        pixel = frame.getpixel((x, y))
-                        # Calculate brightness
-                        brightness = (pixel[0] * 0.299 + pixel[1] * 0.587 + pixel[2] * 0.114) / 255
-                        char_idx = int(brightness * (len(ASCII_CHARS) - 1))
-                        char = ASCII_CHARS[char_idx]
-                        
-                        # Add color based on pixel RGB (orange/red tones for black hole)
-                        r, g, b = pixel
-                        if brightness > 0.1:
-                            # Use 256-color mode for better gradients
-                            color_code = 16 + (36 * min(5, r // 51)) + (6 * min(5, g // 51)) + min(5, b // 51)
-                            row += f'\033[38;5;{color_code}m{char}\033[0m'
-                        else:
-                            row += ' '
-                    ascii_frame.append(row)
-                
-                frames.append(ascii_frame)
-                gif.seek(gif.tell() + 1)
-        except EOFError:
-            pass  # End of frames
+        if frames is None:
+            # Download the GIF (cached on disk after the first run), with a short
+            # timeout so an unreachable network doesn't hold up the splash
+            gif_data = fetch_cached(BLACKHOLE_GIF_URL, BLACKHOLE_GIF_NAME, timeout=2)
+            frames = _spinning_frames(gif_data, width, height)
+            if frames:
+                save_cached_object(frames_name, frames)
         
         if not frames:
             return
         
-        # Hide cursor and clear screen
+        # Hide cursor and clear screen (or just move to top-left)
         sys.stdout.write('\033[?25l')
-        sys.stdout.write('\033[2J')
-        sys.stdout.write('\033[H')
+        sys.stdout.write(CLEAR_HOME if clear_screen else '\033[H')
         sys.stdout.flush()
         
         # Calculate how many times to loop
         frame_delay = 1.0 / fps
         total_frames = int(duration * fps)
         
-        # Play animation
+        # Play animation, paced against a monotonic deadline
+        deadline = time.monotonic()
         for i in range(total_frames):
-            frame_idx = i % len(frames)
-            sys.stdout.write('\033[H')
-            sys.stdout.write('\n'.join(frames[frame_idx]))
-            sys.stdout.flush()
-            time.sleep(frame_delay)
+            _write_frame(frames[i % len(frames)])
+            deadline += frame_delay
+            _sleep_until(deadline)
         
     except Exception:
         # If anything fails, skip silently
@@ -273,14 +477,20 @@ def spinning_animation(width: int = 70, height: int = 20, duration: float = 3.0,
     finally:
         # Show cursor and clear screen
         sys.stdout.write('\033[?25h')
-        sys.stdout.write('\033[2J')
-        sys.stdout.write('\033[H')
+        if clear_screen:
+            sys.stdout.write(CLEAR_HOME)
         sys.stdout.flush()
 
 
 # Number of lines in the ASCII banner (for positioning animations below it)
 BANNER_HEIGHT = BANNER.count('\n') + 2  # +2 for the "Powered by" line and extra newline
 
+# Banner and "Powered by" line as written by show_banner, encoded once
+_BANNER_BYTES = (
+    BANNER + '\n'
+    + f"{DIM}Powered by Datalayer  •  \033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}\n\n"
+).encode('utf-8')
+
 
 def show_banner(splash: bool = False, splash_all: bool = False) -> None:
     """Display the Code AI welcome banner with optional animations.
@@ -290,11 +500,12 @@ def show_banner(splash: bool = False, splash_all: bool = False) -> None:
         splash_all: If True, show both Matrix rain and black hole animations before banner.
     """
     # Only show banner if stdout is a TTY (interactive terminal)
-    if sys.stdout.isatty():
+    if _IS_TTY:
         if splash or splash_all:
-            # Clear screen and show Matrix rain animation first
-            sys.stdout.write('\033[2J')  # Clear screen
-            sys.stdout.write('\033[H')   # Move to top-left
+            # Clear screen and show Matrix rain animation first. It blanks
+            # its own area and leaves the cursor top-left, so the screen
+            # doesn't need clearing again afterwards.
+            sys.stdout.write(CLEAR_HOME)
             sys.stdout.flush()
             try:
                 matrix_rain_banner(width=80, height=20, duration=1.5, fps=12, start_row=0)
@@ -302,17 +513,13 @@ def show_banner(splash: bool = False, splash_all: bool = False) -> None:
                 pass  # Skip animation if terminal doesn't support it
         
         if splash_all:
-            # Show spinning black hole animation
+            # Show spinning black hole animation on the blank screen, then
+            # clear it once before the ASCII banner
             try:
-                spinning_animation(width=70, height=18, duration=2.5, fps=12)
+                spinning_animation(width=70, height=18, duration=2.5, fps=12, clear_screen=False)
             except Exception:
                 pass  # Skip animation if terminal doesn't support it
-        
-        # Clear screen and show ASCII banner after animations
-        if splash or splash_all:
-            sys.stdout.write('\033[2J')  # Clear screen
-            sys.stdout.write('\033[H')   # Move to top-left
+            sys.stdout.write(CLEAR_HOME)
             sys.stdout.flush()
         
-        print(BANNER)
-        print(f"{DIM}Powered by Datalayer  •  \033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}\n")
+        _write_frame(_BANNER_BYTES)
@@ -4,11 +4,13 @@
 
 """Code AI CLI Agent using Pydantic AI and ACP protocol support."""
 
-import asyncio
 import atexit
-import itertools
+import contextlib
+import errno
+import functools
 import multiprocessing
 import os
+import queue
 import signal
 import sys
 import threading
@@ -17,12 +19,14 @@ from enum import Enum
 from typing import List, Optional
 
 import typer
-from pydantic_ai import Agent
 
 
 # Global reference to subprocess for cleanup
 _subprocess_ref: Optional[multiprocessing.Process] = None
 
+# Monotonic time of the last handled signal, to spot a repeated Ctrl-C
+_last_signal_ts = 0.0
+
 
 def _cleanup_subprocess():
     """Clean up subprocess on exit."""
@@ -31,10 +35,10 @@ def _cleanup_subprocess():
         try:
             if _subprocess_ref.is_alive():
                 _subprocess_ref.terminate()
-                _subprocess_ref.join(timeout=2.0)
+                _subprocess_ref.join(timeout=0.5)
                 if _subprocess_ref.is_alive():
                     _subprocess_ref.kill()
-                    _subprocess_ref.join(timeout=1.0)
+                    _subprocess_ref.join(timeout=0.2)
         except Exception:
             pass
         _subprocess_ref = None
@@ -42,10 +46,27 @@ def _cleanup_subprocess():
 
 def _signal_handler(signum, frame):
     """Handle signals by cleaning up subprocess and exiting."""
-    _cleanup_subprocess()
-    # Re-raise with default handler for proper exit
-    signal.signal(signum, signal.SIG_DFL)
-    os.kill(os.getpid(), signum)
+    global _last_signal_ts
+    now = time.monotonic()
+    if now - _last_signal_ts < 0.5:
+        # Second signal in a row: the user wants out now, don't wait on the child
+        process = _subprocess_ref
+        if process is not None:
+            try:
+                process.kill()
+            except Exception:
+                pass
+        os._exit(128 + signum)
+    _last_signal_ts = now
+    if signum == getattr(signal, "SIGTSTP", None):
+        # Ctrl+Z suspends rather than exits: clean up, then let the default
+        # action stop the process
+        _cleanup_subprocess()
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+        return
+    # Exit normally so atexit runs _cleanup_subprocess, the one cleanup site
+    sys.exit(128 + signum)
 
 
 # Register cleanup handlers
@@ -65,6 +86,7 @@ class Transport(str, Enum):
     ag_ui = "ag-ui"
     acp = "acp"
 
+from ._loop import run_coroutine
 from .banner import (
     # Datalayer brand colors
     GREEN_DARK,
@@ -84,9 +106,14 @@ from .banner import (
     RESET,
     BANNER,
     GOODBYE_MESSAGE,
+    _IS_TTY,
     show_banner,
 )
 
+# Datalayer link (OSC 8 hyperlink) and goodbye lines, built once
+_DATALAYER_LINK = "\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\"
+_GOODBYE_TEXT = f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}\n   {GRAY}{_DATALAYER_LINK}{RESET}\n"
+
 # Spinner frames - various styles
 SPINNER_DOTS = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 SPINNER_CIRCLE = ['◐', '◓', '◑', '◒']
@@ -95,13 +122,114 @@ SPINNER_PULSE = ['●', '◉', '○', '◉']
 SPINNER_GROWING_CIRCLE = ['○', '◔', '◑', '◕', '●', '◕', '◑', '◔']
 
 
+class _SpinnerService(threading.Thread):
+    """Single background thread drawing whichever spinner is active.
+    
+    Started on first use and kept for the life of the process, so spinners
+    don't spawn and join a thread each time. Starting or stopping a spinner
+    wakes the thread right away instead of waiting for the next frame.
+    
+    Streamed response text is also written by this thread (see ``emit``),
+    so it can never interleave with a spinner frame, and chunks arriving
+    while a write is in progress go out together in the next one.
+    """
+    
+    # Time between frames in seconds: a few quick frames so a new spinner
+    # visibly moves right away, then a slower steady pace to spare stdout
+    RAMP_FRAMES = 4
+    RAMP_INTERVAL = 0.1
+    INTERVAL = 0.125
+    
+    def __init__(self):
+        super().__init__(name="codeai-spinner", daemon=True)
+        self.lock = threading.Lock()
+        self.changed = threading.Event()
+        self.current: Optional["Spinner"] = None
+        self.output: queue.Queue = queue.Queue()
+    
+    def _write_output(self) -> None:
+        """Write all the queued text in batches, one write and flush per batch."""
+        while True:
+            chunks = []
+            try:
+                while len(chunks) < 64:
+                    chunks.append(self.output.get_nowait())
+            except queue.Empty:
+                pass
+            if not chunks:
+                return
+            try:
+                sys.stdout.write("".join(chunks))
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+            finally:
+                for _ in chunks:
+                    self.output.task_done()
+    
+    def run(self):
+        """Draw a frame of the active spinner per interval, or wait for one."""
+        shown = None
+        drawn = 0
+        while True:
+            self._write_output()
+            interval = None
+            with self.lock:
+                spinner = self.current
+                if spinner is None:
+                    shown = None
+                else:
+                    if spinner is not shown:
+                        shown = spinner
+                        drawn = 0
+                    spinner._draw()
+                    drawn += 1
+                    interval = self.RAMP_INTERVAL if drawn <= self.RAMP_FRAMES else self.INTERVAL
+            self.changed.wait(interval)
+            self.changed.clear()
+    
+    def activate(self, spinner: Optional["Spinner"]) -> None:
+        """Make ``spinner`` the one being drawn (None to draw nothing)."""
+        with self.lock:
+            self.current = spinner
+        self.changed.set()
+    
+    def emit(self, text: str) -> None:
+        """Queue ``text`` to be written to stdout by the service thread."""
+        self.output.put(text)
+        self.changed.set()
+    
+    def drain(self) -> None:
+        """Wait until all the emitted text has been written."""
+        self.output.join()
+
+
+_spinner_service: Optional[_SpinnerService] = None
+_spinner_service_lock = threading.Lock()
+
+
+def _get_spinner_service() -> _SpinnerService:
+    """Return the spinner service, starting its thread on first use."""
+    global _spinner_service
+    with _spinner_service_lock:
+        if _spinner_service is None:
+            _spinner_service = _SpinnerService()
+            _spinner_service.start()
+        return _spinner_service
+
+
 class Spinner:
     """Animated loading spinner for terminal output."""
     
     def __init__(self, message: str = "Thinking", style: str = "circle"):
-        self.message = message
         self.spinner_active = False
-        self.spinner_thread = None
+        self._fd = -1
+        self._render(message, style)
+    
+    def _render(self, message: str, style: str) -> None:
+        """Set the message and style, rendering their frames."""
+        self.message = message
+        self.style = style
         
         # Select spinner style
         if style == "dots":
@@ -116,35 +244,77 @@ class Spinner:
             self.frames = SPINNER_GROWING_CIRCLE
         else:
             self.frames = SPINNER_CIRCLE
+        
+        # Render and encode every frame once (green spinner, gray message) so
+        # drawing is a single binary write, plus the bytes clearing the line
+        self._rendered = [f'\r{GREEN_MEDIUM}{frame}{RESET} {GRAY}{self.message}...{RESET}'.encode() for frame in self.frames]
+        self._clear = ('\r' + ' ' * (len(self.message) + 20) + '\r').encode()
+        self._count = len(self._rendered)
+        self._index = 0
     
-    def _spin(self):
-        """The spinning animation loop."""
-        for frame in itertools.cycle(self.frames):
-            if not self.spinner_active:
-                break
-            # Use green color for the spinner
-            sys.stdout.write(f'\r{GREEN_MEDIUM}{frame}{RESET} {GRAY}{self.message}...{RESET}')
-            sys.stdout.flush()
-            time.sleep(0.1)
+    def _write(self, data: bytes) -> None:
+        """Write straight to the terminal's file descriptor.
         
-        # Clear the spinner line
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 20) + '\r')
-        sys.stdout.flush()
+        Bypasses sys.stdout, so drawing never waits on the lock of the text
+        stream the main thread prints the streamed response through.
+        """
+        try:
+            os.write(self._fd, data)
+        except OSError:
+            pass
+    
+    def _draw(self):
+        """Draw the next frame (called by the spinner service)."""
+        index = self._index
+        self._write(self._rendered[index])
+        index += 1
+        self._index = index if index < self._count else 0
     
     def start(self):
         """Start the spinner animation."""
-        if not sys.stdout.isatty():
+        if not _IS_TTY:
             return
         
+        # Whatever was printed before must reach the terminal first
+        sys.stdout.flush()
+        self._fd = sys.stdout.fileno()
         self.spinner_active = True
-        self.spinner_thread = threading.Thread(target=self._spin, daemon=True)
-        self.spinner_thread.start()
+        _get_spinner_service().activate(self)
+    
+    def restart(self, message: str, style: Optional[str] = None):
+        """Show a new message (and style), starting the spinner if stopped.
+        
+        A running spinner keeps its slot on the spinner thread, which draws
+        the new frames on its next tick, so chained operations need neither
+        a new Spinner nor a stop and start in between.
+        
+        Args:
+            message: Message shown next to the spinner.
+            style: Spinner style, or None to keep the current one.
+        """
+        service = _get_spinner_service()
+        with service.lock:
+            # Clear the old line first, it may be longer than the new one
+            if self.spinner_active and service.current is self:
+                self._write(self._clear)
+            self._render(message, style or self.style)
+        if not self.spinner_active:
+            self.start()
     
     def stop(self):
         """Stop the spinner animation."""
+        if not self.spinner_active:
+            return
         self.spinner_active = False
-        if self.spinner_thread:
-            self.spinner_thread.join()
+        
+        service = _get_spinner_service()
+        with service.lock:
+            if service.current is not self:
+                return
+            service.current = None
+            # Clear the spinner line right away, no frame can be drawn meanwhile
+            self._write(self._clear)
+        service.changed.set()
     
     def __enter__(self):
         """Context manager entry."""
@@ -156,12 +326,24 @@ class Spinner:
         self.stop()
 
 
-from agent_runtimes.specs.models import DEFAULT_MODEL
-
-# Define the Code AI agent with instructions
-agent = Agent(
-    DEFAULT_MODEL.value,
-    instructions="""You are Code AI, a helpful AI assistant specialized in code analysis, 
+@functools.lru_cache(maxsize=1)
+def _get_agent():
+    """Build the Code AI agent on first use.
+    
+    Importing pydantic_ai and the model specs is slow, so it is deferred
+    until a query actually needs the agent instead of paying for it on
+    ``--version`` and ``--help``.
+    
+    Returns:
+        The shared pydantic_ai Agent instance.
+    """
+    from pydantic_ai import Agent
+    from agent_runtimes.specs.models import DEFAULT_MODEL
+    
+    # Define the Code AI agent with instructions
+    return Agent(
+        DEFAULT_MODEL.value,
+        instructions="""You are Code AI, a helpful AI assistant specialized in code analysis, 
     Jupyter notebooks, and data science workflows. You help users with:
     - Writing and debugging code
     - Analyzing Jupyter notebooks
@@ -170,8 +352,29 @@ agent = Agent(
     - Python programming and related tools
     
     Always provide clear, concise, and actionable responses.""",
-    name="Code AI",
-)
+        name="Code AI",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _rich():
+    """Import the Rich pieces used for the startup status, once.
+    
+    Returns:
+        Tuple of (shared Console, rich Spinner class, Live class).
+    """
+    from rich.console import Console
+    from rich.spinner import Spinner as RichSpinner
+    from rich.live import Live
+    
+    return Console(), RichSpinner, Live
+
+
+def __getattr__(name: str):
+    """Keep ``codeai.cli.agent`` available while building it lazily."""
+    if name == "agent":
+        return _get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def run_query_with_spinner(query: str) -> str:
@@ -180,7 +383,7 @@ async def run_query_with_spinner(query: str) -> str:
     
     try:
         spinner.start()
-        result = await agent.run(query)
+        result = await _get_agent().run(query)
         spinner.stop()
         return result.output
     except Exception as e:
@@ -198,87 +401,55 @@ app = typer.Typer(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _version_text() -> str:
+    """Build the version information lines once."""
+    from . import __version__
+    return (
+        f"{GREEN_LIGHT}Code AI{RESET} v{__version__.__version__}\n"
+        f"{GRAY}Powered by Datalayer • {_DATALAYER_LINK}{RESET}\n"
+    )
+
+
 def _show_version() -> None:
     """Display version information."""
-    from . import __version__
-    typer.echo(f"{GREEN_LIGHT}Code AI{RESET} v{__version__.__version__}")
-    typer.echo(f"{GRAY}Powered by Datalayer • \033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
+    sys.stdout.write(_version_text())
+    sys.stdout.flush()
 
 
-def _run_agent_runtime_server(host: str, port: int, agent_id: str, codemode: bool, protocol, port_value=None):
-    """Run the agent-runtimes server (for multiprocessing).
-    
-    This must be a module-level function (not nested) to be picklable.
+# Modules the agent-runtimes server process imports, preloaded by the forkserver
+_SERVER_PRELOAD = ["codeai._server", "agent_runtimes.commands", "agent_runtimes.specs.agents"]
 
-    Args:
-        host: Host to bind to
-        port: Requested port (0 = auto-select a random free port)
-        agent_id: Agent spec ID
-        codemode: Enable codemode
-        protocol: Transport protocol
-        port_value: Optional multiprocessing.Value('i') to communicate the
-            effective port back to the parent process.
+# Multiprocessing context used to start the server (see _server_context)
+_server_ctx = None
+
+
+def _server_context():
+    """Return the forkserver context used to start the agent-runtimes server.
+    
+    The forkserver has the server's heavy imports preloaded, so the server
+    process starts from an interpreter that already imported them.
+    
+    Returns:
+        The forkserver context, or None where the platform has no forkserver
+        (the server is then run as a plain subprocess).
     """
-    import logging
-    import sys
-    import os
-    from agent_runtimes.commands import serve_server, find_random_free_port
-    from agent_runtimes.specs.agents import get_agent_spec
-    
-    # Only suppress logging if not in debug mode
-    debug_mode = os.environ.get('CODEAI_DEBUG') == '1'
-    
-    if not debug_mode:
-        # Redirect stdout and stderr to devnull to keep terminal clean
-        devnull = open(os.devnull, 'w')
-        sys.stdout = devnull
-        sys.stderr = devnull
-        
-        # Suppress all logging
-        logging.getLogger().setLevel(logging.CRITICAL)
-        logging.getLogger("uvicorn").setLevel(logging.CRITICAL)
-        logging.getLogger("uvicorn.access").setLevel(logging.CRITICAL)
-        logging.getLogger("uvicorn.error").setLevel(logging.CRITICAL)
-        logging.getLogger("rich").setLevel(logging.CRITICAL)
-        
-        # Disable Rich console output
-        os.environ["TERM"] = "dumb"
-        os.environ["NO_COLOR"] = "1"
-    else:
-        # Enable debug logging
-        logging.basicConfig(level=logging.DEBUG)
-        print(f"[DEBUG] Starting agent runtime server in debug mode")
-    
-    # Resolve port in this process so we can communicate it back
-    actual_port = port
-    if port == 0:
-        actual_port = find_random_free_port(host)
-
-    # Write effective port to shared value so the parent process can read it
-    if port_value is not None:
-        port_value.value = actual_port
-
-    # Load agent spec to get MCP servers and sandbox variant
-    mcp_servers_str = "tavily"  # Default fallback
-    sandbox_variant = "jupyter"  # Default for codeai
-    agent_spec = get_agent_spec(agent_id)
-    if agent_spec:
-        if agent_spec.mcp_servers:
-            mcp_servers_str = ",".join([server.id for server in agent_spec.mcp_servers])
-        if agent_spec.sandbox_variant:
-            sandbox_variant = agent_spec.sandbox_variant
-    
-    serve_server(
-        host=host,
-        port=actual_port,
-        agent_id=agent_id,
-        agent_name="codeai",
-        no_config_mcp_servers=True,  # Disable config MCP servers
-        mcp_servers=mcp_servers_str,  # Use MCP servers from agent spec
-        codemode=codemode,  # Enable/disable codemode based on flag
-        sandbox_variant=sandbox_variant if codemode else None,
-        protocol=protocol,
-    )
+    global _server_ctx
+    if _server_ctx is None and "forkserver" in multiprocessing.get_all_start_methods():
+        _server_ctx = multiprocessing.get_context("forkserver")
+        _server_ctx.set_forkserver_preload(_SERVER_PRELOAD)
+    return _server_ctx
+
+
+def _warm_server_context() -> None:
+    """Start the forkserver now so its preloading overlaps with the banner and agent selection."""
+    if _server_context() is None:
+        return
+    from multiprocessing import forkserver
+    try:
+        forkserver.ensure_running()
+    except Exception:
+        pass  # The server start will retry and report errors
 
 
 def _start_agent_runtime_server(
@@ -300,24 +471,33 @@ def _start_agent_runtime_server(
         debug: Enable debug logging (default False)
         
     Returns:
-        Tuple of (process, actual_port)
+        Tuple of (process, actual_port), the process being either a
+        multiprocessing.Process or a process-like ``_server.ServerProcess``
     """
-    from agent_runtimes.commands import Protocol
+    from ._server import free_port, popen_server, run_agent_runtime_server
     
-    # Map transport to protocol
-    protocol = Protocol.ag_ui if transport == Transport.ag_ui else Protocol.ag_ui  # ACP uses same server
+    # Map transport to protocol (agent_runtimes.commands.Protocol member name)
+    protocol = "ag_ui" if transport == Transport.ag_ui else "ag_ui"  # ACP uses same server
     
     # Set debug environment variable if needed
     if debug:
         import os
         os.environ['CODEAI_DEBUG'] = '1'
     
+    ctx = _server_context()
+    if ctx is None:
+        # No forkserver: run the server as a fresh subprocess, with the port
+        # resolved here since there is no shared value to report it back
+        if port == 0:
+            port = free_port(host)
+        return popen_server(host, port, agent_id, codemode, protocol, debug=debug), port
+    
     # Shared value so the child process can report the effective port
-    port_value = multiprocessing.Value('i', 0)
+    port_value = ctx.Value('i', 0)
 
-    process = multiprocessing.Process(
-        target=_run_agent_runtime_server,
-        args=(host, port, agent_id, codemode, protocol, port_value),
+    process = ctx.Process(
+        target=run_agent_runtime_server,
+        args=(host, port, agent_id, codemode, protocol, port_value, debug),
         daemon=True
     )
     process.start()
@@ -337,6 +517,29 @@ def _start_agent_runtime_server(
     return process, actual_port
 
 
+_http_client = None
+
+
+def _get_http_client():
+    """Return the process-wide sync HTTP client, creating it on first use.
+    
+    Health probes, startup info and agent listings share this client so
+    repeated requests to the same server reuse one keep-alive connection
+    instead of opening a new one each time. Failed connection attempts
+    are retried twice within the client's pool.
+    
+    Returns:
+        The shared httpx.Client instance.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        
+        _http_client = httpx.Client(timeout=1.0, transport=httpx.HTTPTransport(retries=2))
+        atexit.register(_http_client.close)
+    return _http_client
+
+
 def _wait_for_server(host: str, port: int, timeout: float = 30.0) -> bool:
     """Wait for the server to become available.
     
@@ -348,19 +551,42 @@ def _wait_for_server(host: str, port: int, timeout: float = 30.0) -> bool:
     Returns:
         True if server is ready, False if timeout
     """
+    import selectors
+    import socket
+    
     import httpx
     
     url = f"http://{host}:{port}/health"
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    delay = 0.005
     
-    while time.time() - start_time < timeout:
-        try:
-            response = httpx.get(url, timeout=1.0)
-            if response.status_code == 200:
-                return True
-        except (httpx.ConnectError, httpx.TimeoutException):
-            pass
-        time.sleep(0.2)
+    def port_open() -> bool:
+        """Connect without blocking and wait for the outcome in a selector."""
+        with socket.socket() as sock, selectors.DefaultSelector() as sel:
+            sock.setblocking(False)
+            err = sock.connect_ex((host, port))
+            if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                return False
+            if err:
+                sel.register(sock, selectors.EVENT_WRITE)
+                if not sel.select(max(0.0, deadline - time.monotonic())):
+                    return False
+            return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    
+    # Cheap TCP probe with exponential backoff until the port accepts
+    # connections (refused while nothing listens yet), then confirm with
+    # the health endpoint
+    client = _get_http_client()
+    while time.monotonic() < deadline:
+        if port_open():
+            try:
+                response = client.get(url)
+                if response.status_code == 200:
+                    return True
+            except (httpx.ConnectError, httpx.TimeoutException):
+                pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.1)
     
     return False
 
@@ -375,11 +601,9 @@ def _fetch_startup_info(host: str, port: int) -> dict | None:
     Returns:
         The startup info dict, or None on failure.
     """
-    import httpx
-
     url = f"http://{host}:{port}/health/startup"
     try:
-        response = httpx.get(url, timeout=3.0)
+        response = _get_http_client().get(url, timeout=3.0)
         if response.status_code == 200:
             return response.json()
     except Exception:
@@ -448,6 +672,18 @@ def _spec_has_valid_env(spec) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _sorted_agent_specs() -> tuple:
+    """Load the agent specs once, sorted by id.
+    
+    Returns:
+        The agent specs found by agent_runtimes, as a tuple sorted by id.
+    """
+    from agent_runtimes.specs.agents import list_agent_specs
+    
+    return tuple(sorted(list_agent_specs(), key=lambda s: s.id))
+
+
 def _pick_agentspec_interactive() -> str:
     """Show available agent specs and let the user pick one interactively.
 
@@ -460,34 +696,37 @@ def _pick_agentspec_interactive() -> str:
     Returns:
         The chosen agent spec ID.
     """
-    from agent_runtimes.specs.agents import list_agent_specs
-
-    specs = list_agent_specs()
+    specs = _sorted_agent_specs()
     if not specs:
         print(f"{GREEN_DARK}[ERROR]{RESET} No agent specs found", file=sys.stderr)
         raise typer.Exit(1)
 
     # Partition into valid (enabled + all env vars) and the rest, each sorted by id
-    valid_specs = sorted([s for s in specs if _spec_has_valid_env(s)], key=lambda s: s.id)
-    other_specs = sorted([s for s in specs if not _spec_has_valid_env(s)], key=lambda s: s.id)
+    valid_specs: list = []
+    other_specs: list = []
+    for spec in specs:
+        (valid_specs if _spec_has_valid_env(spec) else other_specs).append(spec)
     ordered = valid_specs + other_specs
     valid_count = len(valid_specs)
+    valid_by_id = {spec.id: spec for spec in valid_specs}
+    other_ids = {spec.id for spec in other_specs}
 
     # Default is the first valid spec (index 0) when available
     default_idx: Optional[int] = 0 if valid_count > 0 else None
 
-    print(f"\n{GREEN_LIGHT}Available Agent Specs:{RESET}\n")
+    # Render the whole listing once and print it in a single call
+    lines = [f"\n{GREEN_LIGHT}Available Agent Specs:{RESET}\n"]
     for i, spec in enumerate(ordered, 1):
         is_valid = i <= valid_count
         bullet = f" {GREEN_MEDIUM}●{RESET}" if is_valid else f" {GRAY}○{RESET}"
         default_marker = f" {GREEN_LIGHT}(default){RESET}" if (i - 1) == default_idx else ""
         num_color = GREEN_MEDIUM if is_valid else GRAY
-        print(f"  {num_color}{i:>3}.{RESET}{bullet} {WHITE}{spec.id}{RESET}{default_marker}")
+        lines.append(f"  {num_color}{i:>3}.{RESET}{bullet} {WHITE}{spec.id}{RESET}{default_marker}")
         if spec.description:
             desc_line = spec.description.strip().split('\n')[0]
             if len(desc_line) > 70:
                 desc_line = desc_line[:67] + "..."
-            print(f"       {GRAY}{desc_line}{RESET}")
+            lines.append(f"       {GRAY}{desc_line}{RESET}")
         # Show required env vars with availability status
         env_vars: set[str] = set()
         for mcp in spec.mcp_servers:
@@ -499,7 +738,8 @@ def _pick_agentspec_interactive() -> str:
                     env_parts.append(f"{GREEN_LIGHT}{var}{RESET}")
                 else:
                     env_parts.append(f"{RED}{var}{RESET}")
-            print(f"       {' '.join(env_parts)}")
+            lines.append(f"       {' '.join(env_parts)}")
+    print("\n".join(lines))
 
     if valid_count == 0:
         print(f"\n{RED}No valid agent specs available.{RESET}")
@@ -507,10 +747,11 @@ def _pick_agentspec_interactive() -> str:
         raise typer.Exit(1)
 
     default_display = f" [{default_idx + 1}]" if default_idx is not None else ""
+    prompt = f"{GREEN_MEDIUM}Choose an agent spec [1-{valid_count}]{default_display}: {RESET}"
     print()
     while True:
         try:
-            choice = input(f"{GREEN_MEDIUM}Choose an agent spec [1-{valid_count}]{default_display}: {RESET}").strip()
+            choice = input(prompt).strip()
             if not choice:
                 if default_idx is not None:
                     chosen = ordered[default_idx]
@@ -529,13 +770,11 @@ def _pick_agentspec_interactive() -> str:
                 print(f"{GRAY}Please enter a number between 1 and {valid_count}.{RESET}")
         except ValueError:
             # Allow typing the spec ID directly (only valid ones)
-            matching = [s for s in valid_specs if s.id == choice]
-            if matching:
-                print(f"\n{GREEN_LIGHT}Selected:{RESET} {matching[0].id}\n")
-                return matching[0].id
+            if choice in valid_by_id:
+                print(f"\n{GREEN_LIGHT}Selected:{RESET} {choice}\n")
+                return choice
             # Check if it matches an invalid spec for a helpful message
-            invalid_match = [s for s in other_specs if s.id == choice]
-            if invalid_match:
+            if choice in other_ids:
                 print(f"{GRAY}Agent spec '{choice}' is not available (disabled or missing env vars).{RESET}")
             else:
                 print(f"{GRAY}Invalid input. Enter a number or a valid agent spec ID.{RESET}")
@@ -598,6 +837,15 @@ def main_callback(
         "--eggs",
         help="Enable Easter egg commands"
     ),
+    reuse_server: bool = typer.Option(
+        False,
+        "--reuse-server",
+        help=(
+            "Single query mode: keep the agent-runtimes server running for later queries "
+            "from the same directory. It stops after CODEAI_SERVER_IDLE_TIMEOUT seconds "
+            "unused (default 300, 0 disables reuse) and keeps the environment it started with"
+        ),
+    ),
     show_version: bool = typer.Option(
         False,
         "--version",
@@ -622,25 +870,36 @@ def main_callback(
         codeai "What is Python?"                   # Single query mode
         
         codeai -a crawler "Search for AI trends"   # Single query with specific agent
+        
+        codeai --reuse-server "What is Python?"    # Keep the server for the next query
     """
     # If a subcommand was invoked, don't run the default behavior
     if ctx.invoked_subcommand is not None:
         return
     
-    if show_version:
+    # Join the query once; a bare "version" query is the version command,
+    # answered before any server, banner or agent selection work
+    query_str = " ".join(query) if query else ""
+    if show_version or query_str.strip().lower() == "version":
         _show_version()
         raise typer.Exit(0)
     
     global _subprocess_ref
     
+    # With --reuse-server, and unless a port or debug output is wanted, a
+    # query reuses the server an earlier query left running, or leaves one
+    # for the next query
+    from ._server import reuse_enabled
+    reuse = bool(query) and reuse_server and port == 0 and not debug and reuse_enabled()
+    
+    # Get the server process pool ready in the background while the banner
+    # and the agent selection are shown (a reusable server is started
+    # without it)
+    if not reuse:
+        _warm_server_context()
+    
     # Show ASCII banner early (before agent selection)
-    from .banner import show_banner, BANNER, DIM, RESET as BANNER_RESET
-    if banner or banner_all:
-        show_banner(splash=banner, splash_all=banner_all)
-    else:
-        if sys.stdout.isatty():
-            print(BANNER)
-            print(f"{DIM}Powered by Datalayer  •  \033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{BANNER_RESET}\n")
+    show_banner(splash=banner, splash_all=banner_all)
     
     # Resolve agent spec: use provided ID or pick interactively
     agent_id = agentspec_id
@@ -649,23 +908,29 @@ def main_callback(
     
     try:
         if query:
-            # Check if user typed "version" as a query - treat as version command
-            query_str = " ".join(query)
-            if query_str.strip().lower() == "version":
-                _show_version()
-                raise typer.Exit(0)
-            
             # Non-interactive mode: start agent-runtimes server and run query
             if agent_id:
-                print(f"{GRAY}Starting agent-runtimes server with {agent_id}...{RESET}")
-                process, actual_port = _start_agent_runtime_server(
-                    agent_id, port=port, transport=Transport.ag_ui, codemode=not codemode_disabled, debug=debug
-                )
-                _subprocess_ref = process  # Register for cleanup
+                from ._server import find_warm_server, forget_warm_server, hold_lease, start_warm_server
+                
+                codemode = not codemode_disabled
+                actual_port = find_warm_server(agent_id, codemode) if reuse else None
+                if actual_port is not None:
+                    print(f"{GRAY}Reusing agent-runtimes server with {agent_id}...{RESET}")
+                elif reuse:
+                    print(f"{GRAY}Starting agent-runtimes server with {agent_id}...{RESET}")
+                    actual_port = start_warm_server("127.0.0.1", agent_id, codemode, "ag_ui")
+                else:
+                    print(f"{GRAY}Starting agent-runtimes server with {agent_id}...{RESET}")
+                    process, actual_port = _start_agent_runtime_server(
+                        agent_id, port=port, transport=Transport.ag_ui, codemode=codemode, debug=debug
+                    )
+                    _subprocess_ref = process  # Register for cleanup
                 
                 # Wait for server to be ready
                 if not _wait_for_server("127.0.0.1", actual_port, timeout=30.0):
                     print(f"{GREEN_DARK}[ERROR]{RESET} Server failed to start", file=sys.stderr)
+                    if reuse:
+                        forget_warm_server(agent_id, codemode)
                     _cleanup_subprocess()
                     raise typer.Exit(1)
                 
@@ -677,26 +942,24 @@ def main_callback(
                 # Connect to the agent and run the query
                 url = f"http://127.0.0.1:{actual_port}/api/v1/ag-ui/codeai/"
                 try:
-                    output = asyncio.run(_run_single_query_ag_ui(url, query_str))
+                    with hold_lease(agent_id, codemode) if reuse else contextlib.nullcontext():
+                        output = run_coroutine(_run_single_query_ag_ui(url, query_str))
                     print(output)
                 finally:
-                    # Cleanup
+                    # Cleanup (a reused server is left running for the next query)
                     _cleanup_subprocess()
             else:
                 # Fall back to local agent
-                output = asyncio.run(run_query_with_spinner(query_str))
+                output = run_coroutine(run_query_with_spinner(query_str))
                 print(output)
         else:
             # Interactive mode: start server and launch TUX
             if agent_id:
-                from rich.console import Console
-                from rich.spinner import Spinner
-                from rich.live import Live
+                console, RichSpinner, Live = _rich()
                 
                 # Show starting message with spinner
-                console = Console()
                 with Live(
-                    Spinner("dots", text=f"[bold cyan]Starting agent runtime...[/bold cyan]", style="cyan"),
+                    RichSpinner("dots", text=f"[bold cyan]Starting agent runtime...[/bold cyan]", style="cyan"),
                     console=console,
                     transient=True,
                     refresh_per_second=10,
@@ -707,7 +970,7 @@ def main_callback(
                     _subprocess_ref = process  # Register for cleanup
                     
                     # Update status while waiting with more visible styling
-                    live.update(Spinner("dots", text=f"[bold cyan]Waiting for agent runtime '{agent_id}' on port {actual_port}...[/bold cyan]", style="cyan"))
+                    live.update(RichSpinner("dots", text=f"[bold cyan]Waiting for agent runtime '{agent_id}' on port {actual_port}...[/bold cyan]", style="cyan"))
                     
                     # Wait for server to be ready
                     if not _wait_for_server("127.0.0.1", actual_port, timeout=60.0):
@@ -716,7 +979,7 @@ def main_callback(
                         _cleanup_subprocess()
                         raise typer.Exit(1)
                     
-                    live.update(Spinner("dots", text=f"[bold green]Agent runtime ready![/bold green]", style="green"))
+                    live.update(RichSpinner("dots", text=f"[bold green]Agent runtime ready![/bold green]", style="green"))
                 
                 # Display startup info
                 startup_info = _fetch_startup_info("127.0.0.1", actual_port)
@@ -746,21 +1009,19 @@ def main_callback(
                     # Use Rich-based TUX
                     from .tux import run_tux
                     extra_suggestions = [s.strip() for s in suggestions.split(",") if s.strip()] if suggestions else []
-                    asyncio.run(run_tux(url, server_url, agent_id="codeai", eggs=eggs, jupyter_url=jupyter_url, extra_suggestions=extra_suggestions))
+                    run_coroutine(run_tux(url, server_url, agent_id="codeai", eggs=eggs, jupyter_url=jupyter_url, extra_suggestions=extra_suggestions))
                 finally:
                     _cleanup_subprocess()
             else:
                 # Fall back to local agent
-                agent.to_cli_sync(prog_name='codeai')
+                _get_agent().to_cli_sync(prog_name='codeai')
                 
     except typer.Exit:
         _cleanup_subprocess()
         raise
     except KeyboardInterrupt:
         _cleanup_subprocess()
-        print(f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}")
-        print(f"   {GRAY}\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
-        print()
+        print(_GOODBYE_TEXT)
         raise typer.Exit(0)
     except Exception as e:
         _cleanup_subprocess()
@@ -786,7 +1047,7 @@ async def _run_single_query_acp(url: str, query: str) -> str:
         async with ACPClient(url) as client:
             spinner.start()
             
-            response_text = ""
+            chunks: list[str] = []
             async for event in client.run(query, stream=True):
                 event_type = event.get("type", "")
                 
@@ -794,13 +1055,13 @@ async def _run_single_query_acp(url: str, query: str) -> str:
                     if spinner.spinner_active:
                         spinner.stop()
                     content = event.get("content", "")
-                    response_text += content
+                    chunks.append(content)
                 
                 elif event_type == "completed":
                     break
             
             spinner.stop()
-            return response_text
+            return "".join(chunks)
             
     except Exception as e:
         spinner.stop()
@@ -826,13 +1087,13 @@ async def _run_single_query_ag_ui(url: str, query: str) -> str:
         async with AGUIClient(url) as client:
             spinner.start()
             
-            response_text = ""
+            chunks: list[str] = []
             async for event in client.run(query):
                 if event.type == EventType.TEXT_MESSAGE_CONTENT:
                     if spinner.spinner_active:
                         spinner.stop()
                     content = event.delta or ""
-                    response_text += content
+                    chunks.append(content)
                 
                 elif event.type == EventType.RUN_FINISHED:
                     break
@@ -841,7 +1102,7 @@ async def _run_single_query_ag_ui(url: str, query: str) -> str:
                     raise Exception(event.error or "Unknown error")
             
             spinner.stop()
-            return response_text
+            return "".join(chunks)
             
     except Exception as e:
         spinner.stop()
@@ -894,11 +1155,11 @@ def connect(
     if transport == Transport.acp:
         print(f"{GREEN_MEDIUM}Connecting via ACP:{RESET} {url}")
         print()
-        asyncio.run(_remote_chat_loop_acp(url))
+        run_coroutine(_remote_chat_loop_acp(url))
     else:
         print(f"{GREEN_MEDIUM}Connecting via AG-UI:{RESET} {url}")
         print()
-        asyncio.run(_remote_chat_loop_ag_ui(url))
+        run_coroutine(_remote_chat_loop_ag_ui(url))
 
 
 async def _remote_chat_loop_acp(url: str) -> None:
@@ -906,6 +1167,7 @@ async def _remote_chat_loop_acp(url: str) -> None:
     from agent_runtimes.transports.clients import ACPClient
     
     try:
+        # One client for the whole session, reused by every chat turn
         async with ACPClient(url) as client:
             agent_info = client.agent_info
             if agent_info:
@@ -925,17 +1187,17 @@ async def _remote_chat_loop_acp(url: str) -> None:
                         continue
                     
                     if user_input.lower() in ("quit", "exit", "q"):
-                        print(f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}")
-                        print(f"   {GRAY}\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
-                        print()
+                        print(_GOODBYE_TEXT)
                         break
                     
                     # Show spinner while waiting
                     spinner = Spinner("Thinking", style="growing")
                     spinner.start()
                     
-                    # Collect response
-                    response_text = ""
+                    # Stream the response through the spinner service thread,
+                    # noting whether any text came through
+                    service = _get_spinner_service()
+                    got_text = False
                     async for event in client.run(user_input, stream=True):
                         event_type = event.get("type", "")
                         
@@ -943,16 +1205,18 @@ async def _remote_chat_loop_acp(url: str) -> None:
                             if spinner.spinner_active:
                                 spinner.stop()
                             content = event.get("content", "")
-                            response_text += content
-                            print(content, end="", flush=True)
+                            if content:
+                                got_text = True
+                                service.emit(content)
                         
                         elif event_type == "completed":
                             break
                     
                     spinner.stop()
+                    service.drain()
                     
                     # If we didn't get streaming text, print final output
-                    if not response_text and "output" in event:
+                    if not got_text and "output" in event:
                         print(f"\n{GREEN_LIGHT}Agent:{RESET} {event.get('output', '')}")
                     else:
                         print()  # Newline after streamed response
@@ -960,9 +1224,7 @@ async def _remote_chat_loop_acp(url: str) -> None:
                     print()
                     
                 except KeyboardInterrupt:
-                    print(f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}")
-                    print(f"   {GRAY}\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
-                    print()
+                    print(_GOODBYE_TEXT)
                     break
                     
     except ConnectionRefusedError:
@@ -978,6 +1240,8 @@ async def _remote_chat_loop_ag_ui(url: str) -> None:
     from ag_ui.core import EventType
     
     try:
+        # One client for the whole session: it holds a single HTTP connection
+        # pool, so every chat turn reuses the same keep-alive connection
         async with AGUIClient(url) as client:
             print(f"{GREEN_LIGHT}Connected to AG-UI agent{RESET}")
             print()
@@ -993,45 +1257,46 @@ async def _remote_chat_loop_ag_ui(url: str) -> None:
                         continue
                     
                     if user_input.lower() in ("quit", "exit", "q"):
-                        print(f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}")
-                        print(f"   {GRAY}\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
-                        print()
+                        print(_GOODBYE_TEXT)
                         break
                     
                     # Show spinner while waiting
                     spinner = Spinner("Thinking", style="growing")
                     spinner.start()
                     
-                    # Collect response
-                    response_text = ""
+                    # Stream the response through the spinner service thread,
+                    # noting whether any text came through
+                    service = _get_spinner_service()
+                    got_text = False
                     async for event in client.run(user_input):
                         if event.type == EventType.TEXT_MESSAGE_CONTENT:
                             if spinner.spinner_active:
                                 spinner.stop()
                             content = event.delta or ""
-                            response_text += content
-                            print(content, end="", flush=True)
+                            if content:
+                                got_text = True
+                                service.emit(content)
                         
                         elif event.type == EventType.RUN_FINISHED:
                             break
                         
                         elif event.type == EventType.RUN_ERROR:
                             spinner.stop()
+                            service.drain()
                             print(f"\n{GREEN_DARK}[ERROR]{RESET} {event.error or 'Unknown error'}", file=sys.stderr)
                             break
                     
                     spinner.stop()
+                    service.drain()
                     
                     # Add newline after streamed response
-                    if response_text:
+                    if got_text:
                         print()
                     
                     print()
                     
                 except KeyboardInterrupt:
-                    print(f"\n{GREEN_LIGHT}{GOODBYE_MESSAGE}{RESET}")
-                    print(f"   {GRAY}\033]8;;https://datalayer.ai\033\\https://datalayer.ai\033]8;;\033\\{RESET}")
-                    print()
+                    print(_GOODBYE_TEXT)
                     break
                     
     except ConnectionRefusedError:
@@ -1062,7 +1327,7 @@ def agents(
     
     try:
         url = f"{server.rstrip('/')}/api/v1/acp/agents"
-        response = httpx.get(url, timeout=10.0)
+        response = _get_http_client().get(url, timeout=10.0)
         response.raise_for_status()
         
         data = response.json()
@@ -1096,6 +1361,9 @@ def agents(
 
 def main() -> None:
     """Main entry point for the Code AI CLI."""
+    from codeai._loop import install_uvloop
+
+    install_uvloop()
     app()
 
 
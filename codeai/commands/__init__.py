@@ -14,8 +14,11 @@ Each command module exports:
 
 from __future__ import annotations
 
+import functools
+import importlib
+import threading
 from dataclasses import dataclass, field
-from typing import Callable, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -27,8 +30,105 @@ class SlashCommand:
     name: str
     aliases: list[str] = field(default_factory=list)
     description: str = ""
-    handler: Optional[Callable] = None
+    handler: Optional[Callable[[], Awaitable[Optional[str]]]] = None  # execute bound to the tux
     shortcut: Optional[str] = None  # e.g., "escape x" for Esc, X
+    shortcut_display: str = ""  # e.g., "Esc,X", shown by /help
+
+
+def truncate(text: str, width: int) -> str:
+    """Shorten text to at most ``width`` characters, ending it with "…" when cut."""
+    if len(text) <= width:
+        return text
+    return text[:width - 1] + "…"
+
+
+def join_more(items: Sequence[Any], count: int, name: Callable[[Any], str] = str) -> str:
+    """Join the names of the first ``count`` items, noting how many are left out.
+
+    Args:
+        items: Items to list.
+        count: Maximum number of items to name.
+        name: Returns the display name of an item.
+
+    Returns:
+        The comma-separated names, e.g. "a, b, c (+2 more)".
+    """
+    text = ", ".join(map(name, items[:count]))
+    if len(items) > count:
+        return f"{text} (+{len(items) - count} more)"
+    return text
+
+
+def open_in_browser(url: str) -> None:
+    """Open a URL in the default browser without waiting for it.
+
+    ``webbrowser.open`` may start a browser process and block for a while,
+    so it runs in a daemon thread to keep the prompt responsive.
+    """
+    import webbrowser
+
+    threading.Thread(target=webbrowser.open, args=(url,), name="codeai-browser", daemon=True).start()
+
+
+# Shortcut key prefixes and how /help shows them
+_SHORTCUT_PREFIXES = (("escape ", "Esc,"), ("c-", "Ctrl+"))
+
+
+def _format_shortcut(shortcut: Optional[str]) -> str:
+    """Format a shortcut string for display."""
+    if not shortcut:
+        return ""
+    for prefix, display in _SHORTCUT_PREFIXES:
+        if shortcut.startswith(prefix):
+            return display + shortcut[len(prefix):].upper()
+    return shortcut
+
+
+# Command modules always registered, in registration order
+_CORE_COMMANDS = (
+    "context",
+    "clear",
+    "help",
+    "status",
+    "exit",
+    "agents",
+    "tools",
+    "mcp_servers",
+    "skills",
+    "codemode_toggle",
+    "context_export",
+    "tools_last",
+    "cls",
+    "browser",
+    "browser_notebook",
+    "browser_lexical",
+    "suggestions",
+)
+
+# Easter egg command modules (--eggs)
+_EGG_COMMANDS = ("rain", "about", "gif")
+
+
+@functools.lru_cache(maxsize=None)
+def _command_spec(module_name: str) -> tuple[str, list[str], str, Optional[str], str, Callable]:
+    """Import a command module and read its definition, once per module.
+
+    Args:
+        module_name: Name of the command module in this package.
+
+    Returns:
+        Tuple of (NAME, ALIASES, DESCRIPTION, SHORTCUT, shortcut display, execute).
+    """
+    mod = importlib.import_module(f".{module_name}", __package__)
+    shortcut = getattr(mod, "SHORTCUT", None)
+    return (
+        mod.NAME,
+        getattr(mod, "ALIASES", []),
+        getattr(mod, "DESCRIPTION", ""),
+        shortcut,
+        _format_shortcut(shortcut),
+        mod.execute,
+    )
 
 
 def build_commands(
@@ -46,79 +146,43 @@ def build_commands(
     Returns:
         Dict mapping command names (including aliases) to SlashCommand instances.
     """
-    from . import (
-        context,
-        clear,
-        help,
-        status,
-        exit,
-        agents,
-        tools,
-        mcp_servers,
-        skills,
-        codemode_toggle,
-        context_export,
-        tools_last,
-        cls,
-        browser,
-        browser_notebook,
-        browser_lexical,
-        suggestions,
-    )
-
-    # Core commands always registered
-    modules = [
-        context,
-        clear,
-        help,
-        status,
-        exit,
-        agents,
-        tools,
-        mcp_servers,
-        skills,
-        codemode_toggle,
-        context_export,
-        tools_last,
-        cls,
-        browser,
-        browser_notebook,
-        browser_lexical,
-        suggestions,
-    ]
-
-    # Conditionally add egg commands
+    # Core commands always registered, then the optional ones, imported
+    # only when registered
+    names = list(_CORE_COMMANDS)
     if eggs:
-        from . import rain, about, gif
-        modules.extend([rain, about, gif])
-
-    # Conditionally add jupyter command
+        names.extend(_EGG_COMMANDS)
     if jupyter_url:
-        from . import jupyter
-        modules.append(jupyter)
+        names.append("jupyter")
 
     commands: dict[str, SlashCommand] = {}
 
-    for mod in modules:
-        # Create handler closure that captures tux
-        handler = _make_handler(mod.execute, tux)
-
+    for name, aliases, description, shortcut, shortcut_display, execute in map(_command_spec, names):
+        # Bind the handler to tux: calling it returns the execute coroutine
         cmd = SlashCommand(
-            name=mod.NAME,
-            aliases=getattr(mod, "ALIASES", []),
-            description=getattr(mod, "DESCRIPTION", ""),
-            handler=handler,
-            shortcut=getattr(mod, "SHORTCUT", None),
+            name=name,
+            aliases=aliases,
+            description=description,
+            handler=functools.partial(execute, tux),
+            shortcut=shortcut,
+            shortcut_display=shortcut_display,
         )
-        commands[cmd.name] = cmd
-        for alias in cmd.aliases:
-            commands[alias] = cmd
+        commands[name] = cmd
+        commands.update(dict.fromkeys(aliases, cmd))
 
     return commands
 
 
-def _make_handler(execute_fn: Callable, tux: "CodeAITux") -> Callable:
-    """Create a handler closure that passes tux to the execute function."""
-    async def handler():
-        return await execute_fn(tux)
-    return handler
+def unique_commands(commands: dict[str, SlashCommand]) -> list[SlashCommand]:
+    """List each command once, leaving out the alias entries.
+
+    Commands come in the order ``sorted(commands.items())`` first meets
+    them, i.e. by the smallest of their name and aliases.
+
+    Args:
+        commands: Dict built by build_commands.
+
+    Returns:
+        List of the distinct SlashCommand instances.
+    """
+    unique = {id(cmd): cmd for cmd in commands.values()}.values()
+    return sorted(unique, key=lambda cmd: min([cmd.name, *cmd.aliases]))
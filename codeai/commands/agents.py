@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from .._json import response_json
+from . import join_more, truncate
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -18,17 +19,24 @@ ALIASES: list[str] = []
 DESCRIPTION = "List available agents on the server"
 SHORTCUT = "escape a"
 
+# Descriptions longer than this are truncated
+DESC_MAX = 60
+
+
+def _skill_name(skill) -> str:
+    """Return the display name of a skill, given as a dict or a plain name."""
+    return skill.get("name", "?") if isinstance(skill, dict) else str(skill)
+
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """List available agents with detailed information."""
     from ..tux import STYLE_PRIMARY, STYLE_ACCENT, STYLE_MUTED
+    from rich.text import Text
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/agents"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        response = await tux.http.get("/api/v1/agents")
+        response.raise_for_status()
+        data = response_json(response)
     except Exception as e:
         tux.console.print(f"[red]Error fetching agents: {e}[/red]")
         return None
@@ -39,63 +47,56 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
         tux.console.print("No agents available", style=STYLE_MUTED)
         return None
 
-    tux.console.print()
-    tux.console.print(f"● Available Agents ({len(agents_list)}):", style=STYLE_PRIMARY)
-    tux.console.print()
-
-    for agent in agents_list:
-        agent_id = agent.get("id", "unknown")
-        name = agent.get("name", "Unknown")
-        description = agent.get("description", "")
-        model = agent.get("model", "unknown")
-        status = agent.get("status", "unknown")
-        toolsets = agent.get("toolsets", {})
-
-        # Status indicator
-        status_icon = "[green]●[/green]" if status == "running" else "[red]○[/red]"
-        tux.console.print(f"  {status_icon} {name} ({agent_id})", style=STYLE_ACCENT)
-
-        # Description
-        if description:
-            desc = description[:60] + "..." if len(description) > 60 else description
-            tux.console.print(f"    {desc}", style=STYLE_MUTED)
-
-        # Model
-        tux.console.print(f"    Model: {model}", style=STYLE_MUTED)
-
-        # Codemode
-        codemode = toolsets.get("codemode", False)
-        codemode_text = "enabled" if codemode else "disabled"
-        codemode_style = STYLE_ACCENT if codemode else STYLE_MUTED
-        tux.console.print(f"    Codemode: ", style=STYLE_MUTED, end="")
-        tux.console.print(codemode_text, style=codemode_style)
-
-        # MCP Servers
-        mcp_servers = toolsets.get("mcp_servers", [])
-        if mcp_servers:
-            mcp_text = ", ".join(mcp_servers[:5])
-            if len(mcp_servers) > 5:
-                mcp_text += f" (+{len(mcp_servers) - 5} more)"
-            tux.console.print(f"    MCP Servers: {mcp_text}", style=STYLE_MUTED)
-
-        # Tools count
-        tools_count = toolsets.get("tools_count", 0)
-        if tools_count > 0:
-            tux.console.print(f"    Tools: {tools_count}", style=STYLE_MUTED)
-
-        # Skills
-        skills = toolsets.get("skills", [])
-        if skills:
-            skill_names = []
-            for s in skills[:3]:
-                if isinstance(s, dict):
-                    skill_names.append(s.get("name", "?"))
-                else:
-                    skill_names.append(str(s))
-            skills_text = ", ".join(skill_names)
-            if len(skills) > 3:
-                skills_text += f" (+{len(skills) - 3} more)"
-            tux.console.print(f"    Skills: {skills_text}", style=STYLE_MUTED)
-
-        tux.console.print()
+    # The codemode line is one of two, built once for all agents
+    codemode_on = Text.assemble(("    Codemode: ", STYLE_MUTED), ("enabled", STYLE_ACCENT))
+    codemode_off = Text("    Codemode: disabled", style=STYLE_MUTED)
+
+    # Buffer the whole listing and write it to the terminal in one go
+    echo = tux.console.print
+    with tux.console:
+        echo()
+        echo(f"● Available Agents ({len(agents_list)}):", style=STYLE_PRIMARY)
+        echo()
+
+        for agent in agents_list:
+            get = agent.get
+            toolsets = get("toolsets") or {}
+            tool_get = toolsets.get
+            agent_id = get("id", "unknown")
+            name = get("name", "Unknown")
+            description = get("description", "")
+
+            # Status indicator
+            status_icon = "[green]●[/green]" if get("status") == "running" else "[red]○[/red]"
+            echo(f"  {status_icon} {name} ({agent_id})", style=STYLE_ACCENT)
+
+            # Description
+            if description:
+                echo(f"    {truncate(description, DESC_MAX)}", style=STYLE_MUTED)
+
+            # Model
+            echo(f"    Model: {get('model', 'unknown')}", style=STYLE_MUTED)
+
+            # Codemode
+            if tool_get("codemode", False):
+                echo(codemode_on)
+            else:
+                echo(codemode_off)
+
+            # MCP Servers
+            mcp_servers = tool_get("mcp_servers")
+            if mcp_servers:
+                echo(f"    MCP Servers: {join_more(mcp_servers, 5)}", style=STYLE_MUTED)
+
+            # Tools count
+            tools_count = tool_get("tools_count", 0)
+            if tools_count > 0:
+                echo(f"    Tools: {tools_count}", style=STYLE_MUTED)
+
+            # Skills
+            skills = tool_get("skills")
+            if skills:
+                echo(f"    Skills: {join_more(skills, 3, _skill_name)}", style=STYLE_MUTED)
+
+            echo()
     return None
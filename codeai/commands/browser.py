@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
-import webbrowser
 from typing import Optional, TYPE_CHECKING
 
+from . import open_in_browser
+
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -20,7 +21,7 @@ SHORTCUT = "escape w"
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Open the Agent chat web UI in the default browser."""
-    url = f"{tux.server_url}/static/agent.html?agentId={tux.agent_id}"
+    url = tux.page_url("agent.html")
     tux.console.print(f"  Opening [bold cyan]{url}[/bold cyan]")
-    webbrowser.open(url)
+    open_in_browser(url)
     return None
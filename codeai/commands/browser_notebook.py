@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
-import webbrowser
 from typing import Optional, TYPE_CHECKING
 
+from . import open_in_browser
+
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -20,19 +21,7 @@ SHORTCUT = "escape n"
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Open the Agent Notebook web UI (notebook + chat) in the default browser."""
-    url = f"{tux.server_url}/static/agent-notebook.html?agentId={tux.agent_id}"
-    if tux.jupyter_url:
-        # Forward Jupyter connection info so the page can reach the kernel
-        import urllib.parse
-        base = tux.jupyter_url.split("?")[0].rstrip("/")
-        query = tux.jupyter_url.split("?")[1] if "?" in tux.jupyter_url else None
-        token = ""
-        if query:
-            params = urllib.parse.parse_qs(query)
-            token = params.get("token", [""])[0]
-        url += f"&jupyterBaseUrl={urllib.parse.quote(base, safe='')}"
-        if token:
-            url += f"&jupyterToken={urllib.parse.quote(token, safe='')}"
+    url = tux.page_url("agent-notebook.html")
     tux.console.print(f"  Opening [bold cyan]{url}[/bold cyan]")
-    webbrowser.open(url)
+    open_in_browser(url)
     return None
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -24,10 +22,8 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     from ..tux import STYLE_PRIMARY, SessionStats
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/agents/{tux.agent_id}/context-details/reset"
-            response = await client.post(url, timeout=10.0)
-            response.raise_for_status()
+        response = await tux.http.post(f"/api/v1/configure/agents/{tux.agent_id}/context-details/reset")
+        response.raise_for_status()
     except Exception as e:
         tux.console.print(f"[red]Error clearing context: {e}[/red]")
         return None
@@ -36,6 +32,9 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     if tux._agui_client is not None:
         await tux._agui_client.disconnect()
         tux._agui_client = None
+    tux._codemode_cache = None
+    tux._context_cache.pop(tux.agent_id, None)
+    tux._json_cache.clear()
 
     tux.stats = SessionStats()
     tux.console.print("● Conversation cleared. Starting fresh.", style=STYLE_PRIMARY)
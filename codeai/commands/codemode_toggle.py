@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
+import time
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from .._json import response_json
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -18,41 +19,43 @@ ALIASES = ["codemode"]
 DESCRIPTION = "Toggle codemode on/off for enhanced code capabilities"
 SHORTCUT = "escape o"
 
+# The only two request bodies, encoded once
+_BODY_ON = b'{"enabled":true}'
+_BODY_OFF = b'{"enabled":false}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Toggle codemode on/off."""
     from ..tux import STYLE_ACCENT, STYLE_MUTED, STYLE_WARNING
 
-    # First get current status
+    # Toggle to the opposite of the current state. The status usually comes
+    # from the TUX cache, leaving the POST as the only round-trip
     try:
-        async with httpx.AsyncClient() as client:
-            status_url = f"{tux.server_url}/api/v1/configure/codemode-status"
-            status_response = await client.get(status_url, timeout=10.0)
-            status_response.raise_for_status()
-            current_status = status_response.json()
-    except Exception as e:
-        tux.console.print(f"[red]Error checking codemode status: {e}[/red]")
-        return None
-
-    current_enabled = current_status.get("enabled", False)
-    new_enabled = not current_enabled
-
-    # Toggle to opposite state
-    try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/codemode/toggle"
-            response = await client.post(
-                url,
-                json={"enabled": new_enabled},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        current_status = await tux.get_codemode_status()
+        new_enabled = not current_status.get("enabled", False)
+        response = await tux.http.post(
+            "/api/v1/configure/codemode/toggle",
+            content=_BODY_ON if new_enabled else _BODY_OFF,
+            headers=_JSON_HEADERS,
+        )
+        response.raise_for_status()
+        data = response_json(response)
     except Exception as e:
+        tux._codemode_cache = None
         tux.console.print(f"[red]Error toggling codemode: {e}[/red]")
         return None
 
     enabled = data.get("enabled", False)
+    # The agent's tools change with codemode
+    tux._json_cache.clear()
+
+    # Write a disabled state through so the next status read skips the
+    # server; once enabled, /skills needs the server's fresh skill lists
+    if enabled:
+        tux._codemode_cache = None
+    else:
+        tux._codemode_cache = (time.monotonic(), {**data, "enabled": False})
 
     tux.console.print()
     if enabled:
@@ -6,10 +6,10 @@
 
 from __future__ import annotations
 
+import time
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-from rich.text import Text
+from .._json import response_json
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -19,24 +19,35 @@ ALIASES: list[str] = []
 DESCRIPTION = "Visualize current context usage as a colored grid"
 SHORTCUT = "escape x"
 
+# Seconds a fetched table is shown again without asking the server
+CACHE_TTL = 2.0
+
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Display context usage visualization."""
-    try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/agents/{tux.agent_id}/context-table?show_context=false"
-            response = await client.get(url, timeout=10.0)
+    from rich.text import Text
+
+    # Re-checking right away shows the table just fetched; sending a
+    # message or /clear drops it
+    cached = tux._context_cache.get(tux.agent_id)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        table_text = cached[1]
+    else:
+        try:
+            response = await tux.http.get(f"/api/v1/configure/agents/{tux.agent_id}/context-table?show_context=false")
             response.raise_for_status()
-            data = response.json()
-    except Exception as e:
-        tux.console.print(f"[red]Error fetching context: {e}[/red]")
-        return None
+            data = response_json(response)
+        except Exception as e:
+            tux.console.print(f"[red]Error fetching context: {e}[/red]")
+            return None
+
+        if data.get("error"):
+            tux.console.print(f"[red]{data.get('error')}[/red]")
+            return None
 
-    if data.get("error"):
-        tux.console.print(f"[red]{data.get('error')}[/red]")
-        return None
+        table_text = data.get("table", "").rstrip()
+        tux._context_cache[tux.agent_id] = (time.monotonic(), table_text)
 
-    table_text = data.get("table", "").rstrip()
     if table_text:
         tux.console.print(Text.from_ansi(table_text))
     else:
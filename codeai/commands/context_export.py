@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from .._json import response_json
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -24,11 +25,11 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     from ..tux import STYLE_ACCENT, STYLE_MUTED
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/agents/{tux.agent_id}/context-export"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        response = await tux.http.get(f"/api/v1/configure/agents/{tux.agent_id}/context-export")
+        response.raise_for_status()
+        data = response_json(response)
+        # Only the decoded JSON is needed from here, drop the raw body
+        del response
     except Exception as e:
         tux.console.print(f"[red]Error fetching context: {e}[/red]")
         return None
@@ -38,15 +39,18 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
         return None
 
     filename = data.get("filename", "codeai_context.csv")
-    csv_content = data.get("csv", "")
+    # Take the CSV out of the dict so it is held once and freed after writing
+    csv_content = data.pop("csv", "")
 
     if not csv_content:
         tux.console.print("[red]No CSV content returned.[/red]")
         return None
 
     try:
-        with open(filename, "w", newline="") as csvfile:
-            csvfile.write(csv_content)
+        # Encode once and hand the bytes to a single write, bypassing the
+        # text layer (the CSV arrives with its own line endings)
+        Path(filename).write_bytes(csv_content.encode("utf-8"))
+        del csv_content
 
         tools_count = data.get("toolsCount", 0)
         messages_count = data.get("messagesCount", 0)
@@ -29,6 +29,10 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
         await tux._agui_client.disconnect()
         tux._agui_client = None
 
+    # Close the shared server API client
+    await tux.aclose()
+    tux._codemode_cache = None
+
     tux.console.print()
     tux.console.print(GOODBYE_MESSAGE, style=STYLE_ACCENT)
     tux.console.print("   [link=https://datalayer.ai]https://datalayer.ai[/link]", style=STYLE_MUTED)
@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
-import webbrowser
 from typing import Optional, TYPE_CHECKING
 
+from . import open_in_browser
+
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -20,14 +21,11 @@ SHORTCUT = "escape j"
 
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Open the Jupyter server API page in the default browser."""
-    if tux.jupyter_url:
-        # Append /api so the browser lands on the Jupyter REST API root
-        sep = "&" if "?" in tux.jupyter_url else "?"
-        base = tux.jupyter_url.split("?")[0].rstrip("/") + "/api"
-        query = tux.jupyter_url.split("?")[1] if "?" in tux.jupyter_url else None
-        url = f"{base}?{query}" if query else base
+    # The browser lands on the Jupyter REST API root
+    url = tux.jupyter_api_url()
+    if url:
         tux.console.print(f"  Opening [bold cyan]{url}[/bold cyan]")
-        webbrowser.open(url)
+        open_in_browser(url)
     else:
         tux.console.print("  [yellow]No Jupyter server available.[/yellow]")
     return None
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from .._json import response_json
+from . import join_more
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -24,11 +25,9 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     from ..tux import STYLE_PRIMARY, STYLE_ACCENT, STYLE_MUTED
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/mcp/servers"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            servers = response.json()
+        response = await tux.http.get("/api/v1/mcp/servers")
+        response.raise_for_status()
+        servers = response_json(response)
     except Exception as e:
         tux.console.print(f"[red]Error fetching MCP servers: {e}[/red]")
         return None
@@ -37,25 +36,24 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
         tux.console.print("No MCP servers running", style=STYLE_MUTED)
         return None
 
-    tux.console.print()
-    tux.console.print(f"● MCP Servers ({len(servers)}):", style=STYLE_PRIMARY)
-    tux.console.print()
+    # Buffer the whole listing and write it to the terminal in one go
+    with tux.console:
+        tux.console.print()
+        tux.console.print(f"● MCP Servers ({len(servers)}):", style=STYLE_PRIMARY)
+        tux.console.print()
 
-    for server in servers:
-        server_id = server.get("id", "Unknown")
-        server_name = server.get("name", server_id)
-        is_available = server.get("isAvailable", False)
-        tools = server.get("tools", [])
+        for server in servers:
+            server_id = server.get("id", "Unknown")
+            server_name = server.get("name", server_id)
+            is_available = server.get("isAvailable", False)
+            tools = server.get("tools", [])
 
-        status = "[green]●[/green]" if is_available else "[red]●[/red]"
-        tux.console.print(f"  {status} {server_name}", style=STYLE_ACCENT)
+            status = "[green]●[/green]" if is_available else "[red]●[/red]"
+            tux.console.print(f"  {status} {server_name}", style=STYLE_ACCENT)
 
-        if tools:
-            tool_names = [t.get("name", "?") for t in tools[:5]]
-            tools_str = ", ".join(tool_names)
-            if len(tools) > 5:
-                tools_str += f" (+{len(tools) - 5} more)"
-            tux.console.print(f"    Tools: {tools_str}", style=STYLE_MUTED)
+            if tools:
+                tools_str = join_more(tools, 5, lambda t: t.get("name", "?"))
+                tux.console.print(f"    Tools: {tools_str}", style=STYLE_MUTED)
 
-    tux.console.print()
+        tux.console.print()
     return None
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from . import truncate
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -25,11 +25,7 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
 
     # First check if codemode is enabled
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/codemode-status"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            status_data = response.json()
+        status_data = await tux.get_codemode_status()
     except Exception as e:
         tux.console.print(f"[red]Error checking codemode status: {e}[/red]")
         return None
@@ -52,22 +48,21 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
         tux.console.print("No skills available", style=STYLE_MUTED)
         return None
 
-    tux.console.print()
-    tux.console.print(f"● Available Skills ({len(skills)}):", style=STYLE_PRIMARY)
-    tux.console.print()
-
-    for skill in skills:
-        skill_name = skill.get("name", "Unknown")
-        skill_desc = skill.get("description", "")
-        is_active = skill_name in active_skills
-        # Truncate description if too long
-        if len(skill_desc) > 60:
-            skill_desc = skill_desc[:57] + "..."
-        # Show active status
-        status_icon = "[green]●[/green]" if is_active else "○"
-        tux.console.print(f"  {status_icon} {skill_name}", style=STYLE_ACCENT if is_active else STYLE_MUTED)
-        if skill_desc:
-            tux.console.print(f"    {skill_desc}", style=STYLE_MUTED)
-
-    tux.console.print()
+    # Buffer the whole listing and write it to the terminal in one go
+    with tux.console:
+        tux.console.print()
+        tux.console.print(f"● Available Skills ({len(skills)}):", style=STYLE_PRIMARY)
+        tux.console.print()
+
+        for skill in skills:
+            skill_name = skill.get("name", "Unknown")
+            skill_desc = truncate(skill.get("description", ""), 60)
+            is_active = skill_name in active_skills
+            # Show active status
+            status_icon = "[green]●[/green]" if is_active else "○"
+            tux.console.print(f"  {status_icon} {skill_name}", style=STYLE_ACCENT if is_active else STYLE_MUTED)
+            if skill_desc:
+                tux.console.print(f"    {skill_desc}", style=STYLE_MUTED)
+
+        tux.console.print()
     return None
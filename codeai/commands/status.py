@@ -6,10 +6,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -19,10 +18,28 @@ DESCRIPTION = "Show Code AI status including model, tokens, and connectivity"
 SHORTCUT = "escape s"
 
 
+async def _probe_health(tux: "CodeAITux") -> str:
+    """Check the server's health endpoint and return the API status markup."""
+    try:
+        # Only the status code matters: skip the body, unless the server
+        # does not route HEAD requests (as FastAPI does for GET endpoints)
+        response = await tux.http.head("/health", timeout=5.0)
+        if response.status_code == 405:
+            response = await tux.http.get("/health", timeout=5.0)
+    except Exception:
+        return "[red]Disconnected[/red]"
+    if response.status_code == 200:
+        return "[green]Connected[/green]"
+    return f"[yellow]Status {response.status_code}[/yellow]"
+
+
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Show status information."""
     from ..tux import STYLE_PRIMARY, STYLE_MUTED
 
+    # Start the connection test first so it runs while the local details print
+    health = asyncio.create_task(_probe_health(tux))
+
     tux.console.print()
     tux.console.print("● Code AI Status", style=STYLE_PRIMARY)
     tux.console.print()
@@ -38,15 +55,7 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     tux.console.print(f"  Server: {tux.server_url}", style=STYLE_MUTED)
 
     # Connection test
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{tux.server_url}/health", timeout=5.0)
-            if response.status_code == 200:
-                tux.console.print("  API: [green]Connected[/green]", style=STYLE_MUTED)
-            else:
-                tux.console.print(f"  API: [yellow]Status {response.status_code}[/yellow]", style=STYLE_MUTED)
-    except Exception:
-        tux.console.print("  API: [red]Disconnected[/red]", style=STYLE_MUTED)
+    tux.console.print(f"  API: {await health}", style=STYLE_MUTED)
 
     # Session stats
     tux.console.print()
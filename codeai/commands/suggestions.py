@@ -8,9 +8,9 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-
 if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
+
     from ..tux import CodeAITux
 
 NAME = "suggestions"
@@ -19,6 +19,20 @@ DESCRIPTION = "List available suggestions and pick one as next prompt"
 SHORTCUT = "escape u"
 
 
+# Prompt session for the choice, created on first use
+_session: Optional["PromptSession"] = None
+
+
+def _get_session() -> "PromptSession":
+    """Return the prompt session used to pick a suggestion."""
+    global _session
+    if _session is None:
+        from prompt_toolkit import PromptSession
+
+        _session = PromptSession()
+    return _session
+
+
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Fetch suggestions from the running agent spec, display them numbered,
     and let the user choose one to use as the next prompt.
@@ -28,16 +42,15 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     """
     from ..tux import STYLE_PRIMARY, STYLE_ACCENT, STYLE_MUTED, STYLE_WARNING
     from ..banner import GREEN_MEDIUM, RESET
+    from prompt_toolkit.formatted_text import ANSI
+    from prompt_toolkit.validation import Validator
+    from rich.text import Text
 
     # Fetch the agent spec which contains the suggestions list
     suggestions: list[str] = []
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/agents/{tux.agent_id}/spec"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
-            suggestions = data.get("suggestions", [])
+        data = await tux.get_json(f"/api/v1/configure/agents/{tux.agent_id}/spec")
+        suggestions = data.get("suggestions", [])
     except Exception as e:
         tux.console.print(f"[red]Error fetching suggestions: {e}[/red]")
         return None
@@ -57,42 +70,48 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     tux.console.print(f"● Suggestions ({len(suggestions)}):", style=STYLE_PRIMARY)
     tux.console.print()
 
-    for i, suggestion in enumerate(suggestions, 1):
-        tux.console.print(f"  {i}. {suggestion}", style=STYLE_ACCENT)
+    # One plain Text for the whole list: a single print, and brackets in
+    # suggestions are not parsed as markup
+    tux.console.print(
+        Text("\n".join(f"  {i}. {suggestion}" for i, suggestion in enumerate(suggestions, 1)), style=STYLE_ACCENT)
+    )
 
     tux.console.print()
 
-    # Prompt user to choose
-    while True:
-        try:
-            choice = input(
-                f"{GREEN_MEDIUM}Choose a suggestion [1-{len(suggestions)}] "
-                f"(Enter to cancel): {RESET}"
-            ).strip()
-
-            if not choice:
-                tux.console.print("  Cancelled.", style=STYLE_MUTED)
-                return None
-
-            idx = int(choice) - 1
-            if 0 <= idx < len(suggestions):
-                selected = suggestions[idx]
-                tux.console.print()
-                tux.console.print("  Selected:", style=STYLE_PRIMARY, end=" ")
-                tux.console.print(selected, style=STYLE_ACCENT)
-                tux.console.print()
-                return selected
-            else:
-                tux.console.print(
-                    f"  Please enter a number between 1 and {len(suggestions)}.",
-                    style=STYLE_MUTED,
-                )
-        except ValueError:
-            tux.console.print(
-                f"  Please enter a number between 1 and {len(suggestions)}.",
-                style=STYLE_MUTED,
-            )
-        except (KeyboardInterrupt, EOFError):
-            tux.console.print()
-            tux.console.print("  Cancelled.", style=STYLE_MUTED)
-            return None
+    # Prompt user to choose, without blocking the event loop. The
+    # validator keeps the prompt open until the input is a valid choice;
+    # it only runs on Enter, and checks isdecimal() before parsing so an
+    # invalid choice never goes through int()'s exception path
+    count = len(suggestions)
+
+    def is_choice(text: str) -> bool:
+        text = text.strip()
+        return not text or (text.isdecimal() and 1 <= int(text) <= count)
+
+    validator = Validator.from_callable(
+        is_choice,
+        error_message=f"Please enter a number between 1 and {count}.",
+        move_cursor_to_end=True,
+    )
+    try:
+        choice = await _get_session().prompt_async(
+            ANSI(f"{GREEN_MEDIUM}Choose a suggestion [1-{count}] (Enter to cancel): {RESET}"),
+            validator=validator,
+            validate_while_typing=False,
+        )
+    except (KeyboardInterrupt, EOFError):
+        tux.console.print()
+        tux.console.print("  Cancelled.", style=STYLE_MUTED)
+        return None
+
+    choice = choice.strip()
+    if not choice:
+        tux.console.print("  Cancelled.", style=STYLE_MUTED)
+        return None
+
+    selected = suggestions[int(choice) - 1]
+    tux.console.print()
+    tux.console.print("  Selected:", style=STYLE_PRIMARY, end=" ")
+    tux.console.print(selected, style=STYLE_ACCENT)
+    tux.console.print()
+    return selected
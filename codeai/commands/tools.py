@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Optional, TYPE_CHECKING
 
-import httpx
+from . import truncate
 
 if TYPE_CHECKING:
     from ..tux import CodeAITux
@@ -22,13 +22,13 @@ SHORTCUT = "escape t"
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """List available tools for the current agent."""
     from ..tux import STYLE_PRIMARY, STYLE_ACCENT, STYLE_MUTED
+    from rich.text import Text
 
     try:
-        async with httpx.AsyncClient() as client:
-            url = f"{tux.server_url}/api/v1/configure/agents/{tux.agent_id}/context-snapshot"
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            data = response.json()
+        # Short TTL: MCP servers still starting add their tools meanwhile
+        data = await tux.get_json(
+            f"/api/v1/configure/agents/{tux.agent_id}/context-snapshot", ttl=5.0
+        )
     except Exception as e:
         tux.console.print(f"[red]Error fetching tools: {e}[/red]")
         return None
@@ -43,15 +43,13 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     tux.console.print(f"● Available Tools ({len(tools)}):", style=STYLE_PRIMARY)
     tux.console.print()
 
+    # Build the whole listing as one Text and render it in a single print
+    listing = Text()
     for tool in tools:
-        tool_name = tool.get("name", "Unknown")
-        tool_desc = tool.get("description", "")
-        # Truncate description if too long
-        if len(tool_desc) > 60:
-            tool_desc = tool_desc[:57] + "..."
-        tux.console.print(f"  • {tool_name}", style=STYLE_ACCENT)
+        listing.append(f"  • {tool.get('name', 'Unknown')}\n", style=STYLE_ACCENT)
+        tool_desc = truncate(tool.get("description", ""), 60)
         if tool_desc:
-            tux.console.print(f"    {tool_desc}", style=STYLE_MUTED)
+            listing.append(f"    {tool_desc}\n", style=STYLE_MUTED)
 
-    tux.console.print()
+    tux.console.print(listing)
     return None
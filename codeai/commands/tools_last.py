@@ -6,9 +6,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Optional, TYPE_CHECKING
 
+from .._json import loads
+
 if TYPE_CHECKING:
     from ..tux import CodeAITux
 
@@ -18,12 +19,22 @@ DESCRIPTION = "Show details of tool calls from last response"
 SHORTCUT = "escape l"
 
 
+def _indent(text: str, prefix: str) -> str:
+    """Prefix every line of text, ending it with a newline.
+
+    Works on the whole string instead of splitting it into a list of
+    lines, which matters for tool results of several megabytes.
+    """
+    return prefix + text.replace("\n", "\n" + prefix) + "\n"
+
+
 async def execute(tux: "CodeAITux") -> Optional[str]:
     """Show detailed information about tool calls from the last response."""
     from ..tux import (
         STYLE_PRIMARY, STYLE_ACCENT, STYLE_MUTED,
         STYLE_ERROR, STYLE_WARNING,
     )
+    from rich.text import Text
 
     if not tux.tool_calls:
         tux.console.print()
@@ -35,44 +46,49 @@ async def execute(tux: "CodeAITux") -> Optional[str]:
     tux.console.print(f"● Tool Calls from Last Response ({len(tux.tool_calls)}):", style=STYLE_PRIMARY)
     tux.console.print()
 
-    for i, tc in enumerate(tux.tool_calls, 1):
-        # Status indicator
-        if tc.status == "complete":
-            status_icon = "[green]✓[/green]"
-        elif tc.status == "error":
-            status_icon = "[red]✗[/red]"
-        else:
-            status_icon = "[yellow]●[/yellow]"
+    # Status icon and style by tool call status, anything else is pending
+    icons = {"complete": ("✓", STYLE_ACCENT), "error": ("✗", STYLE_ERROR)}
+    pending = ("●", STYLE_WARNING)
 
+    # Build every call's details as one Text and render it in a single print
+    # (as plain text, so brackets in arguments and results are not markup)
+    details = Text()
+    for i, tc in enumerate(tux.tool_calls, 1):
         # Tool header
-        tux.console.print(f"  {status_icon} {i}. {tc.tool_name}", style=STYLE_PRIMARY)
+        icon, icon_style = icons.get(tc.status, pending)
+        details.append("  ")
+        details.append(icon, style=icon_style)
+        details.append(f" {i}. {tc.tool_name}\n", style=STYLE_PRIMARY)
+
+        # Everything below the header is muted: gather it and add it as a
+        # single span rather than one span per line
+        muted: list[str] = []
 
         # Arguments - show complete details
         if tc.args_json:
             try:
-                args = json.loads(tc.args_json)
-                if isinstance(args, dict):
-                    for key, value in args.items():
-                        val_str = str(value)
-                        # Show full value, preserving newlines with indentation
-                        if "\n" in val_str:
-                            tux.console.print(f"     {key}:", style=STYLE_MUTED)
-                            for line in val_str.split("\n"):
-                                tux.console.print(f"       {line}", style=STYLE_MUTED)
-                        else:
-                            tux.console.print(f"     {key}: {val_str}", style=STYLE_MUTED)
-                else:
-                    tux.console.print(f"     args: {tc.args_json}", style=STYLE_MUTED)
-            except json.JSONDecodeError:
-                tux.console.print(f"     args: {tc.args_json}", style=STYLE_MUTED)
+                args = loads(tc.args_json)
+            except ValueError:  # json and orjson decode errors
+                args = None
+            if isinstance(args, dict):
+                for key, value in args.items():
+                    val_str = str(value)
+                    # Show full value, preserving newlines with indentation
+                    if "\n" in val_str:
+                        muted.append(f"     {key}:\n")
+                        muted.append(_indent(val_str, "       "))
+                    else:
+                        muted.append(f"     {key}: {val_str}\n")
+            else:
+                muted.append(f"     args: {tc.args_json}\n")
 
         # Result - show complete details
         if tc.result:
-            tux.console.print("     result:", style=STYLE_MUTED)
-            for line in tc.result.split("\n"):
-                tux.console.print(f"       │ {line}", style=STYLE_MUTED)
+            muted.append("     result:\n")
+            muted.append(_indent(tc.result, "       │ "))
 
-        tux.console.print()
+        muted.append("\n")
+        details.append("".join(muted), style=STYLE_MUTED)
 
-    tux.console.print()
+    tux.console.print(details)
     return None
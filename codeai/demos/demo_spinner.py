@@ -2,13 +2,11 @@
 """
 Demo script showing Code AI spinner in realistic scenarios.
 This simulates different operation durations to showcase the spinner animation.
+
+Run with: python -m codeai.demos.demo_spinner
 """
 
 import asyncio
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
 
 from codeai.cli import Spinner, GREEN, CYAN, YELLOW, MAGENTA, RESET, BOLD
 
@@ -19,13 +17,12 @@ async def simulate_ai_query(duration: float):
     return "✓ Query processed successfully!"
 
 
-async def demo_scenario(title: str, message: str, duration: float, style: str = "growing"):
-    """Run a single demo scenario."""
+async def demo_scenario(spinner: Spinner, title: str, message: str, duration: float, style: str = "growing"):
+    """Run a single demo scenario, reusing the given spinner."""
     print(f"\n{CYAN}{BOLD}{title}{RESET}")
     print(f"{YELLOW}{'─' * 50}{RESET}")
     
-    spinner = Spinner(message, style=style)
-    spinner.start()
+    spinner.restart(message, style)
     
     result = await simulate_ai_query(duration)
     
@@ -48,8 +45,10 @@ async def main():
         ("Model Inference", "Running AI model", 3.5, "circle"),
     ]
     
+    # One spinner for all the scenarios
+    spinner = Spinner("")
     for title, message, duration, style in scenarios:
-        await demo_scenario(title, message, duration, style)
+        await demo_scenario(spinner, title, message, duration, style)
     
     print(f"\n{GREEN}{BOLD}✨ Demo complete!{RESET}")
     print(f"{CYAN}The spinner provides smooth visual feedback during operations.{RESET}")
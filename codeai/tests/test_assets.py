@@ -0,0 +1,50 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Tests for the on-disk object cache of codeai.animations.assets."""
+
+import pickle
+
+import pytest
+
+from codeai.animations import assets
+
+
+class Unpicklable:
+    def __reduce__(self):
+        raise pickle.PicklingError("Unpicklable")
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the cache in a temporary XDG_CACHE_HOME."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "codeai"
+
+
+@pytest.mark.parametrize("name", ["frames.pickle", "frames.pickle.gz"])
+def test_round_trip(name):
+    frames = [("ab", (1, 2, 3)), ("cd", None)]
+
+    assets.save_cached_object(name, frames)
+
+    assert assets.load_cached_object(name) == frames
+
+
+def test_missing_object():
+    assert assets.load_cached_object("missing.pickle") is None
+
+
+@pytest.mark.parametrize("name", ["frames.pickle", "frames.pickle.gz"])
+def test_corrupt_file(cache_home, name):
+    cache_home.mkdir()
+    (cache_home / name).write_bytes(b"not a pickle")
+
+    assert assets.load_cached_object(name) is None
+
+
+def test_unpicklable_object(cache_home):
+    assets.save_cached_object("unpicklable.pickle", Unpicklable())
+
+    assert not (cache_home / "unpicklable.pickle").exists()
@@ -0,0 +1,74 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Tests for the slash command helpers of codeai.commands."""
+
+import pytest
+
+from codeai.commands import SlashCommand, build_commands, join_more, truncate, unique_commands
+
+
+@pytest.mark.parametrize(
+    ("text", "width", "expected"),
+    [
+        ("", 5, ""),
+        ("short", 5, "short"),
+        ("longer text", 6, "longe…"),
+        ("ab", 1, "…"),
+    ],
+)
+def test_truncate(text, width, expected):
+    result = truncate(text, width)
+
+    assert result == expected
+    assert len(result) <= width
+
+
+@pytest.mark.parametrize(
+    ("items", "count", "expected"),
+    [
+        ([], 3, ""),
+        (["a", "b"], 3, "a, b"),
+        (["a", "b", "c"], 3, "a, b, c"),
+        (["a", "b", "c", "d", "e"], 3, "a, b, c (+2 more)"),
+    ],
+)
+def test_join_more(items, count, expected):
+    assert join_more(items, count) == expected
+
+
+def test_join_more_name():
+    tools = [{"name": "read"}, {"name": "write"}, {"name": "run"}]
+
+    assert join_more(tools, 2, name=lambda t: t["name"]) == "read, write (+1 more)"
+
+
+def sorted_and_shown(commands):
+    """The /help listing order before unique_commands existed."""
+    listed = []
+    shown = set()
+    for _, cmd in sorted(commands.items()):
+        if cmd.name in shown:
+            continue
+        shown.add(cmd.name)
+        listed.append(cmd)
+    return listed
+
+
+@pytest.mark.parametrize(
+    ("eggs", "jupyter_url"),
+    [(False, None), (True, None), (True, "http://localhost:8888/?token=abc")],
+)
+def test_unique_commands_order(eggs, jupyter_url):
+    commands = build_commands(object(), eggs=eggs, jupyter_url=jupyter_url)
+
+    assert unique_commands(commands) == sorted_and_shown(commands)
+
+
+def test_unique_commands_alias_sorts_first():
+    zed = SlashCommand(name="zed", aliases=["a"])
+    bee = SlashCommand(name="bee")
+    commands = {"zed": zed, "a": zed, "bee": bee}
+
+    assert unique_commands(commands) == [zed, bee] == sorted_and_shown(commands)
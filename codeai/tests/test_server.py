@@ -0,0 +1,203 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Tests for the reusable server state files of codeai._server."""
+
+import json
+import multiprocessing
+import os
+import secrets
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from codeai import _server
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="Server reuse is POSIX only")
+
+# Tokens of the fake server process and of some other process
+TOKEN = secrets.token_hex(16)
+OTHER_TOKEN = secrets.token_hex(16)
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    """Point the state directory at a fresh XDG_RUNTIME_DIR."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def server_process():
+    """A process carrying a token on its command line, like a reusable server."""
+    process = subprocess.Popen(  # noqa: S603 - our own interpreter, fixed arguments
+        [sys.executable, "-c", "import time; print(flush=True); time.sleep(60)", "--token", TOKEN],
+        stdout=subprocess.PIPE,
+    )
+    process.stdout.readline()  # Started, with its final command line
+    yield process
+    process.kill()
+    process.wait()
+    process.stdout.close()
+
+
+def write_state(path, mode=0o600, **state):
+    with open(path, "w") as f:
+        json.dump(state, f)
+    os.chmod(path, mode)
+
+
+def test_state_path_is_private(runtime_dir):
+    path = _server._state_path("codeai/agent", codemode=True)
+
+    state_dir = os.path.dirname(path)
+    assert state_dir == str(runtime_dir / f"codeai-{os.getuid()}")
+    assert os.stat(state_dir).st_mode & 0o777 == 0o700
+    assert os.path.basename(path).startswith("codeai_agent-codemode-")
+    assert _server._state_path("codeai/agent", codemode=False) != path
+
+
+def test_state_path_rejects_shared_directory(runtime_dir):
+    state_dir = os.path.dirname(_server._state_path("codeai", codemode=True))
+    os.chmod(state_dir, 0o777)  # noqa: S103 - the case under test
+
+    assert _server._state_path("codeai", codemode=True) is None
+    assert not _server.reuse_enabled()
+
+
+def test_find_warm_server(runtime_dir, server_process):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=TOKEN)
+
+    assert _server.find_warm_server("codeai", codemode=True) == 4242
+    assert os.path.exists(path)
+
+
+def test_find_warm_server_without_state(runtime_dir):
+    assert _server.find_warm_server("codeai", codemode=True) is None
+
+
+def test_find_warm_server_stale_pid(runtime_dir):
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=TOKEN)
+
+    assert _server.find_warm_server("codeai", codemode=True) is None
+    assert not os.path.exists(path)
+
+
+def test_find_warm_server_wrong_token(runtime_dir, server_process):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=OTHER_TOKEN)
+
+    assert _server.find_warm_server("codeai", codemode=True) is None
+    assert not os.path.exists(path)
+    assert process.poll() is None
+
+
+@pytest.mark.parametrize("mode", [0o620, 0o602])
+def test_find_warm_server_writable_by_others(runtime_dir, server_process, mode):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, mode=mode, pid=process.pid, port=4242, token=TOKEN)
+
+    assert _server.find_warm_server("codeai", codemode=True) is None
+
+
+def test_find_warm_server_foreign_file(runtime_dir, server_process):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=TOKEN)
+    try:
+        os.chown(path, os.getuid() + 1, -1)
+    except PermissionError:
+        pytest.skip("Changing the file owner needs root")
+
+    assert _server.find_warm_server("codeai", codemode=True) is None
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]", ""])
+def test_find_warm_server_malformed_state(runtime_dir, content):
+    path = _server._state_path("codeai", codemode=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+    assert _server.find_warm_server("codeai", codemode=True) is None
+
+
+def test_forget_warm_server(runtime_dir, server_process):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=TOKEN)
+
+    _server.forget_warm_server("codeai", codemode=True)
+
+    assert not os.path.exists(path)
+    assert process.wait(timeout=10) == -15
+
+
+def test_forget_warm_server_spares_other_processes(runtime_dir, server_process):
+    process = server_process
+    path = _server._state_path("codeai", codemode=True)
+    write_state(path, pid=process.pid, port=4242, token=OTHER_TOKEN)
+
+    _server.forget_warm_server("codeai", codemode=True)
+
+    assert not os.path.exists(path)
+    assert process.poll() is None
+
+
+@pytest.fixture
+def fake_agent_runtimes(tmp_path, monkeypatch):
+    """An agent_runtimes package whose serve_server reports how it was started."""
+    report = tmp_path / "report.json"
+    package = tmp_path / "agent_runtimes"
+    (package / "specs").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "specs" / "__init__.py").write_text("")
+    (package / "specs" / "agents.py").write_text("def get_agent_spec(agent_id):\n    return None\n")
+    (package / "commands.py").write_text(textwrap.dedent(f"""\
+        import enum
+        import json
+        import sys
+
+        Protocol = enum.Enum("Protocol", "ag_ui")
+
+        def find_random_free_port(host):
+            return 4242
+
+        def serve_server(**kwargs):
+            with open({str(report)!r}, "w") as f:
+                json.dump({{"quiet": sys.stdout is not sys.__stdout__}}, f)
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return report
+
+
+@pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(), reason="No forkserver"
+)
+@pytest.mark.parametrize("debug", [True, False])
+def test_forkserver_child_sees_debug(fake_agent_runtimes, monkeypatch, debug):
+    # The forkserver starts before the CLI knows about --debug, so the child
+    # must not depend on the environment it inherits
+    monkeypatch.delenv("CODEAI_DEBUG", raising=False)
+    ctx = multiprocessing.get_context("forkserver")
+    port_value = ctx.Value("i", 0)
+    process = ctx.Process(
+        target=_server.run_agent_runtime_server,
+        args=("127.0.0.1", 0, "codeai", True, "ag_ui", port_value, debug),
+    )
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    assert port_value.value == 4242
+    assert json.loads(fake_agent_runtimes.read_text()) == {"quiet": not debug}
@@ -1,12 +1,10 @@
 #!/usr/bin/env python3
-"""Test script to demonstrate Code AI spinner animations."""
+"""Test script to demonstrate Code AI spinner animations.
 
-import sys
-import time
-from pathlib import Path
+Run with: python -m codeai.tests.test_spinner
+"""
 
-# Add parent directory to path to import codeai
-sys.path.insert(0, str(Path(__file__).parent))
+import time
 
 from codeai.cli import Spinner, GREEN, CYAN, MAGENTA, YELLOW, RESET, BOLD
 
@@ -0,0 +1,137 @@
+# Copyright (c) 2025-2026 Datalayer, Inc.
+#
+# BSD 3-Clause License
+
+"""Tests for the server API response caches of CodeAITux."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from codeai import tux as tux_module
+from codeai.commands import clear, codemode_toggle
+from codeai.tux import CodeAITux
+
+
+class FakeClock:
+    """Stands in for time.monotonic so cache entries can be aged on demand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(tux_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def server():
+    """A fake agent-runtimes server counting the requests per path."""
+    state = {"enabled": False, "requests": {}}
+
+    def handler(request):
+        path = request.url.path
+        state["requests"][path] = state["requests"].get(path, 0) + 1
+        if path == "/api/v1/configure/codemode-status":
+            return httpx.Response(200, json={"enabled": state["enabled"]})
+        if path == "/api/v1/configure/codemode/toggle":
+            state["enabled"] = not state["enabled"]
+            return httpx.Response(200, json={"enabled": state["enabled"]})
+        if path.endswith("/context-details/reset"):
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json={"path": path, "count": state["requests"][path]})
+
+    state["transport"] = httpx.MockTransport(handler)
+    return state
+
+
+@pytest.fixture
+def tux(server):
+    tux = CodeAITux("http://testserver/agent", server_url="http://testserver")
+    tux._http = httpx.AsyncClient(base_url=tux.server_url, transport=server["transport"])
+    tux.console.quiet = True
+    yield tux
+    asyncio.run(tux.aclose())
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_get_json_reuses_response(tux, server, clock):
+    first = run(tux.get_json("/api/v1/tools"))
+    clock.now += 29.0
+    second = run(tux.get_json("/api/v1/tools"))
+
+    assert first == second == {"path": "/api/v1/tools", "count": 1}
+    assert server["requests"]["/api/v1/tools"] == 1
+
+
+def test_get_json_ttl_expiry(tux, server, clock):
+    run(tux.get_json("/api/v1/tools", ttl=5.0))
+    clock.now += 5.0
+
+    assert run(tux.get_json("/api/v1/tools", ttl=5.0))["count"] == 2
+
+
+def test_get_json_raises_http_errors(tux):
+    tux._http = httpx.AsyncClient(
+        base_url=tux.server_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(tux.get_json("/api/v1/tools"))
+    assert tux._json_cache == {}
+
+
+def test_get_codemode_status_ttl(tux, server, clock):
+    run(tux.get_codemode_status())
+    clock.now += 4.0
+    run(tux.get_codemode_status())
+    assert server["requests"]["/api/v1/configure/codemode-status"] == 1
+
+    clock.now += 1.0
+    run(tux.get_codemode_status())
+    assert server["requests"]["/api/v1/configure/codemode-status"] == 2
+
+
+def test_clear_drops_caches(tux, server, clock):
+    run(tux.get_json("/api/v1/tools"))
+    run(tux.get_codemode_status())
+
+    run(clear.execute(tux))
+
+    assert run(tux.get_json("/api/v1/tools"))["count"] == 2
+    run(tux.get_codemode_status())
+    assert server["requests"]["/api/v1/configure/codemode-status"] == 2
+
+
+def test_codemode_toggle_on_drops_caches(tux, server, clock):
+    run(tux.get_json("/api/v1/tools"))
+
+    run(codemode_toggle.execute(tux))
+
+    assert server["enabled"]
+    assert run(tux.get_json("/api/v1/tools"))["count"] == 2
+    assert run(tux.get_codemode_status()) == {"enabled": True}
+    assert server["requests"]["/api/v1/configure/codemode-status"] == 2
+
+
+def test_codemode_toggle_off_writes_status_through(tux, server, clock):
+    server["enabled"] = True
+    run(tux.get_json("/api/v1/tools"))
+
+    run(codemode_toggle.execute(tux))
+
+    assert not server["enabled"]
+    assert run(tux.get_json("/api/v1/tools"))["count"] == 2
+    assert run(tux.get_codemode_status()) == {"enabled": False}
+    assert server["requests"]["/api/v1/configure/codemode-status"] == 1
@@ -6,6 +6,7 @@
 
 import asyncio
 import getpass
+import importlib.util
 import json
 import sys
 import time
@@ -13,7 +14,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
 
-from .commands import SlashCommand, build_commands
+from ._json import response_json
+from .commands import SlashCommand, build_commands, join_more, truncate, unique_commands
 
 import httpx
 from prompt_toolkit import PromptSession
@@ -58,6 +60,12 @@ SYMBOL_MESSAGES = "⛁"
 SYMBOL_FREE = "⛶"
 SYMBOL_BUFFER = "⛝"
 
+# Speak HTTP/2 to the server, multiplexing concurrent requests over one
+# connection, when h2 is installed (it comes with the httpx[http2] extra).
+# HTTP/2 is negotiated over TLS only: a plain http:// server, such as the
+# local one the CLI starts, keeps pooled HTTP/1.1 keep-alive connections
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 
 class SlashCommandCompleter(Completer):
     """Completer for slash commands with menu-style display."""
@@ -89,9 +97,7 @@ class SlashCommandCompleter(Completer):
                 shown.add(cmd.name)
                 
                 # Truncate description to fit in menu
-                desc = cmd.description
-                if len(desc) > 70:
-                    desc = desc[:67] + "..."
+                desc = truncate(cmd.description, 70)
                 
                 yield Completion(
                     text=f"/{cmd.name}",
@@ -119,20 +125,13 @@ class ToolCallInfo:
             args = json.loads(self.args_json)
             if isinstance(args, dict):
                 # Show key=value pairs with truncated values
-                items = list(args.items())[:3]
-                parts = []
-                for k, v in items:
-                    val_str = str(v).replace("\n", " ")
-                    if len(val_str) > max_value_len:
-                        val_str = val_str[:max_value_len - 3] + "..."
-                    parts.append(f"{k}={val_str}")
-                summary = ", ".join(parts)
-                if len(args) > 3:
-                    summary += f" (+{len(args) - 3} more)"
-                return summary
-            return self.args_json[:60] + "..." if len(self.args_json) > 60 else self.args_json
+                def pair(item: tuple) -> str:
+                    val_str = str(item[1]).replace("\n", " ")
+                    return f"{item[0]}={truncate(val_str, max_value_len)}"
+                return join_more(list(args.items()), 3, pair)
+            return truncate(self.args_json, 60)
         except json.JSONDecodeError:
-            return self.args_json[:60] + "..." if len(self.args_json) > 60 else self.args_json
+            return truncate(self.args_json, 60)
 
 
 @dataclass
@@ -184,11 +183,18 @@ class CodeAITux:
         self.context_window: int = 128000
         self.tool_calls: list[ToolCallInfo] = []  # Track tool calls from last response
         self._agui_client: Optional[Any] = None  # Persistent AG-UI client for conversation history
+        self._http: Optional[httpx.AsyncClient] = None  # Shared server API client (see http)
+        self._codemode_cache: Optional[tuple[float, dict]] = None  # (fetched at, codemode status)
+        self._context_cache: dict[str, tuple[float, str]] = {}  # agent_id -> (fetched at, /context table)
+        self._json_cache: dict[str, tuple[float, Any]] = {}  # path -> (fetched at, data), see get_json
+        self._page_urls: dict[str, str] = {}  # Web UI page URLs (see page_url)
+        self._jupyter_api_url: Optional[str] = None
         
         # Initialize slash commands
         self.commands: dict[str, SlashCommand] = build_commands(
             self, eggs=eggs, jupyter_url=jupyter_url
         )
+        self.unique_commands: list[SlashCommand] = unique_commands(self.commands)  # For /help
         
         # Initialize prompt session with slash command completer
         # Style for the completion menu matching Datalayer brand colors
@@ -203,6 +209,122 @@ class CodeAITux:
         })
         self.prompt_session: Optional[PromptSession] = None
     
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """HTTP client for the agent-runtimes server API, created on first use.
+        
+        Shared by the TUX and all slash commands so their requests reuse
+        pooled keep-alive connections. Paths are relative to ``server_url``.
+        Closed by /exit.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.server_url,
+                timeout=httpx.Timeout(10.0, connect=2.0, pool=5.0),
+                # Pool options go to the transport, which also retries failed connects
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=30.0),
+                    http2=_HAS_H2,
+                ),
+            )
+        return self._http
+    
+    async def get_codemode_status(self, ttl: float = 5.0) -> dict:
+        """Return the server's codemode status, cached for ``ttl`` seconds.
+        
+        /skills and /codemode-toggle both start from this status, often
+        back to back, and it only changes through /codemode-toggle (which
+        writes the new state through to the cache).
+        
+        Args:
+            ttl: Maximum age in seconds of a cached status.
+        
+        Returns:
+            The codemode status as returned by the server.
+        
+        Raises:
+            httpx.HTTPError: If the status could not be fetched.
+        """
+        cached = self._codemode_cache
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        response = await self.http.get("/api/v1/configure/codemode-status")
+        response.raise_for_status()
+        status = response_json(response)
+        self._codemode_cache = (time.monotonic(), status)
+        return status
+    
+    async def get_json(self, path: str, ttl: float = 30.0) -> Any:
+        """Fetch and decode a server API response, reusing it for a while.
+        
+        For responses that rarely change within a session, such as the
+        agent spec read by /suggestions and the tool list read by /tools.
+        /clear and /codemode-toggle drop the cached responses, and sending
+        a message drops the cached context snapshot.
+        
+        Args:
+            path: API path, relative to ``server_url``.
+            ttl: Maximum age in seconds of a cached response.
+        
+        Returns:
+            The decoded JSON body.
+        
+        Raises:
+            httpx.HTTPError: If the response could not be fetched.
+        """
+        cached = self._json_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        response = await self.http.get(path)
+        response.raise_for_status()
+        data = response_json(response)
+        self._json_cache[path] = (time.monotonic(), data)
+        return data
+    
+    async def aclose(self) -> None:
+        """Close the server API client and its pooled connections, if open."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def page_url(self, page: str) -> str:
+        """Return the URL of an agent web UI page, built once per page.
+        
+        When a Jupyter server is available, its base URL and token are
+        forwarded so the page can reach the kernel.
+        
+        Args:
+            page: Page under /static on the server, e.g. "agent-lexical.html".
+        
+        Returns:
+            The full URL of the page for this agent.
+        """
+        url = self._page_urls.get(page)
+        if url is None:
+            url = f"{self.server_url}/static/{page}?agentId={self.agent_id}"
+            if self.jupyter_url:
+                import urllib.parse
+                base, _, query = self.jupyter_url.partition("?")
+                token = urllib.parse.parse_qs(query).get("token", [""])[0] if query else ""
+                url += f"&jupyterBaseUrl={urllib.parse.quote(base.rstrip('/'), safe='')}"
+                if token:
+                    url += f"&jupyterToken={urllib.parse.quote(token, safe='')}"
+            self._page_urls[page] = url
+        return url
+    
+    def jupyter_api_url(self) -> Optional[str]:
+        """Return the Jupyter REST API root URL (with token), built once.
+        
+        Returns:
+            The URL, or None when no Jupyter server is available.
+        """
+        if self._jupyter_api_url is None and self.jupyter_url:
+            base, _, query = self.jupyter_url.partition("?")
+            base = base.rstrip("/") + "/api"
+            self._jupyter_api_url = f"{base}?{query}" if query else base
+        return self._jupyter_api_url
+    
     def _format_tokens(self, tokens: int) -> str:
         """Format token count with K suffix for thousands."""
         if tokens >= 1000:
@@ -385,6 +507,9 @@ class CodeAITux:
         
         self.stats.messages += 1
         self.tool_calls = []  # Reset tool calls for this response
+        # The turn changes the context, and tools may have come up meanwhile
+        self._context_cache.pop(self.agent_id, None)
+        self._json_cache.pop(f"/api/v1/configure/agents/{self.agent_id}/context-snapshot", None)
         current_tool_call: Optional[ToolCallInfo] = None
         turn_start = time.monotonic()
         
@@ -405,14 +530,12 @@ class CodeAITux:
             # Use a colored bullet (blink doesn't work in most terminals)
             self.console.print("● ", style=STYLE_PRIMARY, end="")
             
-            response_text = ""
             input_tokens = 0
             output_tokens = 0
             
             async for event in client.run(message):
                 if event.type == EventType.TEXT_MESSAGE_CONTENT:
                     content = event.delta or ""
-                    response_text += content
                     self.console.print(content, end="", markup=False)
                 
                 elif event.type == EventType.TOOL_CALL_START:
@@ -456,8 +579,7 @@ class CodeAITux:
                             tc.result = str(result) if result else ""
                             tc.status = "complete"
                             # Show completion
-                            result_preview = tc.result[:80] + "..." if len(tc.result) > 80 else tc.result
-                            result_preview = result_preview.replace("\n", " ")
+                            result_preview = truncate(tc.result, 80).replace("\n", " ")
                             self.console.print(f"    ✓ {result_preview}", style=STYLE_ACCENT)
                             break
                     current_tool_call = None
@@ -479,15 +601,13 @@ class CodeAITux:
             
             # Fetch updated usage stats
             try:
-                async with httpx.AsyncClient() as http_client:
-                    url = f"{self.server_url}/api/v1/configure/agents/{self.agent_id}/context-snapshot"
-                    resp = await http_client.get(url, timeout=5.0)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        input_tokens = data.get("sumResponseInputTokens", 0)
-                        output_tokens = data.get("sumResponseOutputTokens", 0)
-                        self.model_name = data.get("modelName", self.model_name) or self.model_name
-                        self.context_window = data.get("contextWindow", self.context_window)
+                resp = await self.http.get(f"/api/v1/configure/agents/{self.agent_id}/context-snapshot", timeout=5.0)
+                if resp.status_code == 200:
+                    data = response_json(resp)
+                    input_tokens = data.get("sumResponseInputTokens", 0)
+                    output_tokens = data.get("sumResponseOutputTokens", 0)
+                    self.model_name = data.get("modelName", self.model_name) or self.model_name
+                    self.context_window = data.get("contextWindow", self.context_window)
             except Exception:
                 pass
             
@@ -527,10 +647,7 @@ class CodeAITux:
         
         completed = sum(1 for tc in self.tool_calls if tc.status == "complete")
         total = len(self.tool_calls)
-        tool_names = [tc.tool_name for tc in self.tool_calls[:3]]
-        tools_str = ", ".join(tool_names)
-        if len(self.tool_calls) > 3:
-            tools_str += f" (+{len(self.tool_calls) - 3} more)"
+        tools_str = join_more(self.tool_calls, 3, lambda tc: tc.tool_name)
         
         self.console.print(
             f"  ⚙ {completed}/{total} tools executed: {tools_str}  ",
@@ -545,42 +662,44 @@ class CodeAITux:
         
         # Fetch initial model info
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.server_url}/api/v1/configure/agents/{self.agent_id}/context-snapshot"
-                response = await client.get(url, timeout=5.0)
-                if response.status_code == 200:
-                    data = response.json()
-                    # Try to get model name from various sources
-                    self.model_name = data.get("modelName") or "claude-sonnet-4"
-                    self.context_window = data.get("contextWindow", 128000)
+            response = await self.http.get(f"/api/v1/configure/agents/{self.agent_id}/context-snapshot", timeout=5.0)
+            if response.status_code == 200:
+                data = response_json(response)
+                # Try to get model name from various sources
+                self.model_name = data.get("modelName") or "claude-sonnet-4"
+                self.context_window = data.get("contextWindow", 128000)
         except Exception:
             pass
         
         self.show_welcome()
         
-        while self.running:
-            try:
-                user_input = await self.show_prompt()
-                
-                if not user_input:
-                    continue
-                
-                # Check for slash commands
-                if user_input.startswith("/"):
-                    result = await self.handle_command(user_input)
-                    # If a command returned a prompt string, send it to the agent
-                    if result:
-                        await self.send_message(result)
-                else:
-                    await self.send_message(user_input)
+        try:
+            while self.running:
+                try:
+                    user_input = await self.show_prompt()
                     
-            except KeyboardInterrupt:
-                self.console.print()
-                from .commands import exit as _exit_cmd
-                await _exit_cmd.execute(self)
-            except EOFError:
-                from .commands import exit as _exit_cmd
-                await _exit_cmd.execute(self)
+                    if not user_input:
+                        continue
+                    
+                    # Check for slash commands
+                    if user_input.startswith("/"):
+                        result = await self.handle_command(user_input)
+                        # If a command returned a prompt string, send it to the agent
+                        if result:
+                            await self.send_message(result)
+                    else:
+                        await self.send_message(user_input)
+                        
+                except KeyboardInterrupt:
+                    self.console.print()
+                    from .commands import exit as _exit_cmd
+                    await _exit_cmd.execute(self)
+                except EOFError:
+                    from .commands import exit as _exit_cmd
+                    await _exit_cmd.execute(self)
+        finally:
+            # Release pooled connections however the loop ends
+            await self.aclose()
 
 
 async def run_tux(